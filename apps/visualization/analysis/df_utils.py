@@ -3,19 +3,23 @@
 這些函數不依賴於數據庫操作，可以獨立使用於任何pandas DataFrame。
 """
 
-from typing import List
+from typing import Callable, List, Tuple
 
+import numpy as np
 import pandas as pd
 
 from config.settings import logger
 
 
-def prepare_jobs_analysis_df(jobs_df: pd.DataFrame) -> pd.DataFrame:
+def prepare_jobs_analysis_df(
+    jobs_df: pd.DataFrame, as_of: pd.Timestamp = None
+) -> pd.DataFrame:
     """
     準備具有標準化列名和計算字段的職缺分析DataFrame。
 
     參數:
         jobs_df: 包含原始職缺數據的DataFrame
+        as_of: 計算在架天數的基準日期，預設為今天零時
 
     返回:
         具有標準化列用於分析的DataFrame
@@ -58,9 +62,10 @@ def prepare_jobs_analysis_df(jobs_df: pd.DataFrame) -> pd.DataFrame:
         jobs_analysis["上架日期"] = pd.to_datetime(
             jobs_df["appearDate"], format="%Y%m%d"
         )
-        jobs_analysis["在架天數"] = (
-            pd.Timestamp.now() - jobs_analysis["上架日期"]
-        ).dt.days
+        # 在架天數只取到日，基準固定為當日零時，同一天內結果穩定
+        if as_of is None:
+            as_of = pd.Timestamp.now().normalize()
+        jobs_analysis["在架天數"] = (as_of - jobs_analysis["上架日期"]).dt.days
 
         # 識別長期未招滿的職缺（在架超過30天）
         jobs_analysis["是否長期未招滿"] = jobs_analysis["在架天數"] > 30
@@ -79,6 +84,30 @@ def prepare_jobs_analysis_df(jobs_df: pd.DataFrame) -> pd.DataFrame:
     return jobs_analysis
 
 
+def _parse_ranges_by_unique(
+    values: pd.Series, parser: Callable[[str], Tuple[int, int]]
+) -> np.ndarray:
+    """
+    對每個不同的描述文字只解析一次，再依編碼展開回原始長度。
+
+    應徵人數與薪資描述的取值種類很少（如「0~5人應徵」），逐行解析會重複大量相同的工作。
+
+    參數:
+        values: 描述文字Series
+        parser: 將單個描述解析為(最小值, 最大值)的函數
+
+    返回:
+        形狀為(n, 2)的int32數組，空值對應(0, 0)
+    """
+    codes, uniques = pd.factorize(values)
+    # 直接收集(最小值, 最大值)元組，避免每個值都構造一個pd.Series
+    parsed = list(map(parser, uniques.tolist()))
+    # 最後一行是空值（編碼為-1）的解析結果
+    parsed.append((0, 0))
+    lookup = np.asarray(parsed, dtype=np.int32)
+    return lookup[codes]
+
+
 def extract_application_counts(jobs_analysis: pd.DataFrame) -> pd.DataFrame:
     """
     從應徵描述中提取應徵人數。
@@ -117,9 +146,9 @@ def extract_application_counts(jobs_analysis: pd.DataFrame) -> pd.DataFrame:
         return 0, 0
 
     # 應用提取函數
-    result_df[["最少應徵人數", "最多應徵人數"]] = result_df["應徵人數範圍"].apply(
-        lambda x: pd.Series(extract_apply_count(x))
-    )
+    counts = _parse_ranges_by_unique(result_df["應徵人數範圍"], extract_apply_count)
+    result_df["最少應徵人數"] = counts[:, 0]
+    result_df["最多應徵人數"] = counts[:, 1]
 
     # 計算平均應徵人數
     result_df["平均應徵人數"] = (
@@ -182,9 +211,9 @@ def extract_salary_range(jobs_analysis: pd.DataFrame) -> pd.DataFrame:
         return 0, 0
 
     # 應用提取函數
-    result_df[["最低薪資", "最高薪資"]] = result_df["薪資範圍"].apply(
-        lambda x: pd.Series(extract_salary(x))
-    )
+    salaries = _parse_ranges_by_unique(result_df["薪資範圍"], extract_salary)
+    result_df["最低薪資"] = salaries[:, 0]
+    result_df["最高薪資"] = salaries[:, 1]
 
     # 計算平均薪資
     result_df["平均薪資"] = (result_df["最低薪資"] + result_df["最高薪資"]) / 2
@@ -220,6 +249,39 @@ def analyze_industry_distribution(jobs_df: pd.DataFrame) -> pd.DataFrame:
     return industry_counts
 
 
+def jobs_fingerprint(jobs_df: pd.DataFrame) -> tuple:
+    """
+    計算職缺數據的輕量指紋，作為分析結果快取的鍵。
+
+    只對行數、上架日期範圍和職缺編號的哈希值計算，避免Streamlit對整個DataFrame（含列表欄位）進行哈希。
+    原始數據和prepare_jobs_analysis_df產生的分析數據（中文欄位名）都適用。
+
+    參數:
+        jobs_df: 職缺數據DataFrame
+
+    返回:
+        tuple: 職缺數據的指紋
+    """
+    job_no_col = next((c for c in ("jobNo", "職缺編號") if c in jobs_df.columns), None)
+    date_col = next(
+        (c for c in ("appearDate", "上架日期") if c in jobs_df.columns), None
+    )
+
+    job_no_hash = (
+        int(pd.util.hash_pandas_object(jobs_df[job_no_col], index=False).sum())
+        if job_no_col is not None
+        else None
+    )
+    if date_col is None:
+        return (len(jobs_df), job_no_hash)
+    return (
+        len(jobs_df),
+        str(jobs_df[date_col].min()),
+        str(jobs_df[date_col].max()),
+        job_no_hash,
+    )
+
+
 def get_job_display_columns(df: pd.DataFrame = None) -> List[str]:
     """
     獲取標準的職缺顯示欄位列表。
@@ -251,3 +313,53 @@ def get_job_display_columns(df: pd.DataFrame = None) -> List[str]:
         return [col for col in standard_cols if col in df.columns]
 
     return standard_cols
+
+
+def lttb_downsample_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    以Largest-Triangle-Three-Buckets (LTTB)演算法選出代表性的數據點索引。
+
+    首尾兩點必定保留，其餘數據分成n_out-2個桶，每桶選出與前一選中點及下一桶平均點
+    組成最大三角形面積的點，藉此在減少點數的同時保留峰值和谷值。
+
+    參數:
+        x: 橫軸數值（日期可傳入datetime64數組）
+        y: 縱軸數值
+        n_out: 輸出的點數
+
+    返回:
+        選中點在原數組中的索引，按升序排列
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype("datetime64[ns]").astype(np.int64)
+    x = x.astype(np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # 中間的n-2個點平均分成n_out-2個桶，bounds[i]:bounds[i+1]為第i個桶
+    bounds = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = bounds[i], bounds[i + 1]
+        # 下一個桶的平均點，最後一個桶的下一個「桶」就是最後一個點
+        next_end = bounds[i + 2] if i + 2 < len(bounds) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        area = np.abs(
+            (x[prev] - avg_x) * (y[start:end] - y[prev])
+            - (x[prev] - x[start:end]) * (avg_y - y[prev])
+        )
+        prev = start + int(np.argmax(area))
+        indices[i + 1] = prev
+
+    return indices
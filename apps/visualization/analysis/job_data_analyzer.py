@@ -4,20 +4,173 @@
 """
 
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Tuple
 
 import pandas as pd
+import streamlit as st
 
 from apps.visualization.analysis.df_utils import (
     analyze_industry_distribution,
     extract_application_counts,
     extract_salary_range,
     get_job_display_columns,
+    jobs_fingerprint,
     prepare_jobs_analysis_df,
 )
 from config.settings import logger
 from src.database.duckdb_manager import DuckDBManager
 
+# 分析結果快取的存活時間（秒）
+CACHE_TTL = 600
+
+# 預先計算的小寫關鍵詞搜索文本欄位
+KEYWORD_SEARCH_COLUMN = "_kw_lower"
+
+
+def _build_keyword_search_text(search_keyword: pd.Series) -> pd.Series:
+    """
+    將search_keyword欄位合併為小寫的搜索文本。
+
+    參數:
+        search_keyword: search_keyword欄位，值可能為列表或字符串
+
+    返回:
+        小寫的搜索文本Series
+    """
+    return (
+        search_keyword.apply(lambda x: " ".join(x) if isinstance(x, list) else str(x))
+        .fillna("")
+        .str.lower()
+    )
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_fetch_jobs(
+    _db_manager: DuckDBManager, db_limit: int, include_inactive: bool
+) -> pd.DataFrame:
+    """
+    快取數據庫原始查詢結果，並預先計算小寫的關鍵詞搜索文本。
+
+    只改變關鍵詞、城市或月份時不會重新查詢數據庫，也不會重新計算搜索文本。
+
+    參數:
+        _db_manager: DuckDBManager實例，使用前導下劃線告訴Streamlit不要嘗試對此參數進行哈希處理
+        db_limit: 最大獲取職缺數量
+        include_inactive: 是否包含已下架的職缺
+
+    返回:
+        包含原始職缺的DataFrame
+    """
+    jobs_df = _db_manager.get_jobs(limit=db_limit, include_inactive=include_inactive)
+
+    if not jobs_df.empty and "search_keyword" in jobs_df.columns:
+        jobs_df[KEYWORD_SEARCH_COLUMN] = _build_keyword_search_text(
+            jobs_df["search_keyword"]
+        )
+
+    return jobs_df
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_get_jobs(
+    _analyzer: "JobDataAnalyzer",
+    limit,
+    months: int,
+    keywords: Tuple[str, ...],
+    city: str,
+    district: str,
+    include_inactive: bool,
+) -> pd.DataFrame:
+    """
+    以過濾條件元組為鍵快取職缺查詢結果。
+
+    參數:
+        _analyzer: JobDataAnalyzer實例，使用前導下劃線告訴Streamlit不要嘗試對此參數進行哈希處理
+        limit: 最大獲取職缺數量
+        months: 只獲取最近N個月的職缺
+        keywords: 關鍵詞元組
+        city: 城市
+        district: 地區
+        include_inactive: 是否包含已下架的職缺
+
+    返回:
+        包含過濾後職缺的DataFrame
+    """
+    return _analyzer._query_jobs(
+        limit, months, list(keywords), city, district, include_inactive
+    )
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_prepare_jobs_analysis_df(
+    fingerprint: tuple, as_of: pd.Timestamp, _jobs_df: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    以數據指紋和基準日期為鍵快取prepare_jobs_analysis_df的結果。
+
+    數據含列表欄位，無法直接哈希，以指紋為鍵可避免每次重新執行時序列化整個DataFrame。
+
+    參數:
+        fingerprint: 職缺數據的指紋
+        as_of: 計算在架天數的基準日期，每日更新一次
+        _jobs_df: 包含原始職缺數據的DataFrame，不參與哈希
+
+    返回:
+        具有標準化列用於分析的DataFrame
+    """
+    return prepare_jobs_analysis_df(_jobs_df, as_of)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_extract_application_counts(
+    fingerprint: tuple, _jobs_analysis: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    以數據指紋為鍵快取extract_application_counts的結果。
+
+    參數:
+        fingerprint: 職缺分析數據的指紋
+        _jobs_analysis: 包含職缺分析數據的DataFrame，不參與哈希
+
+    返回:
+        添加了應徵人數列的DataFrame
+    """
+    return extract_application_counts(_jobs_analysis)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_extract_salary_range(
+    fingerprint: tuple, _jobs_analysis: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    以數據指紋為鍵快取extract_salary_range的結果。
+
+    參數:
+        fingerprint: 職缺分析數據的指紋
+        _jobs_analysis: 包含職缺分析數據的DataFrame，不參與哈希
+
+    返回:
+        添加了薪資範圍列的DataFrame
+    """
+    return extract_salary_range(_jobs_analysis)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_analyze_industry_distribution(
+    fingerprint: tuple, _jobs_df: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    以數據指紋為鍵快取analyze_industry_distribution的結果，不對整個DataFrame哈希。
+
+    參數:
+        fingerprint: 職缺數據的指紋
+        _jobs_df: 包含職缺數據的DataFrame，不參與哈希
+
+    返回:
+        包含產業分佈統計的DataFrame
+    """
+    return analyze_industry_distribution(_jobs_df)
+
 
 class JobDataAnalyzer:
     """
@@ -53,6 +206,8 @@ class JobDataAnalyzer:
         """
         從數據庫獲取職缺，並可選擇性地進行過濾。
 
+        結果以過濾條件為鍵進行快取，相同的過濾條件在快取有效期間內不會重複查詢數據庫。
+
         參數:
             limit: 最大獲取職缺數量，如果是"無限制"則不限制數量
             months: 如果提供，只獲取最近N個月的職缺
@@ -64,6 +219,28 @@ class JobDataAnalyzer:
         返回:
             包含過濾後職缺的DataFrame
         """
+        return _cached_get_jobs(
+            self,
+            limit,
+            months,
+            tuple(keywords) if keywords else (),
+            city,
+            district,
+            include_inactive,
+        )
+
+    def _query_jobs(
+        self,
+        limit,
+        months: int = None,
+        keywords: List[str] = None,
+        city: str = None,
+        district: str = None,
+        include_inactive: bool = False,
+    ) -> pd.DataFrame:
+        """
+        實際從數據庫查詢並過濾職缺，參數與get_jobs相同。
+        """
         # 處理"無限制"選項
         if limit == "無限制":
             # 使用一個非常大的數字作為實際限制，相當於無限制
@@ -72,9 +249,7 @@ class JobDataAnalyzer:
             db_limit = limit
 
         # 從數據庫獲取指定數量的職缺
-        jobs_df = self.db_manager.get_jobs(
-            limit=db_limit, include_inactive=include_inactive
-        )
+        jobs_df = _cached_fetch_jobs(self.db_manager, db_limit, include_inactive)
 
         if jobs_df.empty:
             logger.warning("數據庫中沒有找到職缺")
@@ -99,7 +274,8 @@ class JobDataAnalyzer:
         if keywords or city or district:
             jobs_df = self.filter_jobs_by_keywords(jobs_df, keywords, city, district)
 
-        return jobs_df
+        # 刪除預先計算的搜索文本欄位
+        return jobs_df.drop(columns=KEYWORD_SEARCH_COLUMN, errors="ignore")
 
     def filter_jobs_by_keywords(
         self,
@@ -120,7 +296,9 @@ class JobDataAnalyzer:
         返回:
             過濾後的DataFrame
         """
-        filtered_df = jobs_df.copy()
+        # 布林索引本身就會產生新的DataFrame，這裡不需要預先複製整個jobs_df；
+        # 搜索文本使用局部Series，不會修改傳入的DataFrame
+        filtered_df = jobs_df
 
         # 如果提供了關鍵詞，進行過濾
         if keywords and len(keywords) > 0:
@@ -131,64 +309,45 @@ class JobDataAnalyzer:
                 # 使用search_keyword欄位進行過濾
                 logger.info("使用search_keyword欄位進行過濾")
 
-                # 創建一個臨時列來存儲搜索文本
-                filtered_df["search_text_temp"] = filtered_df["search_keyword"].apply(
-                    lambda x: " ".join(x) if isinstance(x, list) else str(x)
-                )
-
-                # 將空值填充為空字符串，並轉換為小寫
-                filtered_df["search_text_temp"] = (
-                    filtered_df["search_text_temp"].fillna("").str.lower()
-                )
-
-                # 按每個關鍵詞過濾
-                for keyword in keywords:
-                    keyword = keyword.lower()
-                    filtered_df = filtered_df[
-                        filtered_df["search_text_temp"].str.contains(keyword, na=False)
-                    ]
-
-                # 刪除臨時列
-                filtered_df = filtered_df.drop("search_text_temp", axis=1)
+                # 優先使用讀取時已預先計算的小寫搜索文本，否則臨時計算
+                if KEYWORD_SEARCH_COLUMN in filtered_df.columns:
+                    search_text = filtered_df[KEYWORD_SEARCH_COLUMN]
+                else:
+                    search_text = _build_keyword_search_text(
+                        filtered_df["search_keyword"]
+                    )
             else:
                 # 如果沒有search_keyword欄位，則使用原來的方法
                 logger.info("search_keyword欄位不存在，使用組合文本進行過濾")
-                # 創建用於搜索的組合文本字段
+                # 創建用於搜索的組合文本
                 if (
                     "jobDetail" in filtered_df.columns
                     and "jobName" in filtered_df.columns
                 ):
-                    filtered_df["search_text"] = (
+                    search_text = (
                         filtered_df["jobName"]
                         + " "
                         + filtered_df["jobDetail"].fillna("")
                     )
                 elif "jobName" in filtered_df.columns:
-                    filtered_df["search_text"] = filtered_df["jobName"]
+                    search_text = filtered_df["jobName"]
                 else:
-                    # 如果兩個列都不存在，創建一個空列
-                    filtered_df["search_text"] = ""
+                    # 如果兩個列都不存在，使用空字符串
+                    search_text = pd.Series("", index=filtered_df.index)
 
                 # 如果有公司名稱，添加到搜索文本中
                 if "custName" in filtered_df.columns:
-                    filtered_df["search_text"] = (
-                        filtered_df["search_text"]
-                        + " "
-                        + filtered_df["custName"].fillna("")
-                    )
+                    search_text = search_text + " " + filtered_df["custName"].fillna("")
 
                 # 將搜索文本轉換為小寫，以便進行不區分大小寫的搜索
-                filtered_df["search_text"] = filtered_df["search_text"].str.lower()
-
-                # 按每個關鍵詞過濾
-                for keyword in keywords:
-                    keyword = keyword.lower()
-                    filtered_df = filtered_df[
-                        filtered_df["search_text"].str.contains(keyword, na=False)
-                    ]
+                search_text = search_text.str.lower()
 
-                # 刪除臨時搜索文本列
-                filtered_df = filtered_df.drop("search_text", axis=1)
+            # 按每個關鍵詞過濾
+            for keyword in keywords:
+                keyword = keyword.lower()
+                mask = search_text.str.contains(keyword, na=False)
+                filtered_df = filtered_df[mask]
+                search_text = search_text[mask]
 
         # 如果提供了城市，進行過濾
         if city and "city" in filtered_df.columns:
@@ -203,17 +362,24 @@ class JobDataAnalyzer:
         logger.info(f"過濾後的職缺: {len(filtered_df)} 個，共 {len(jobs_df)} 個")
         return filtered_df
 
-    def prepare_jobs_analysis_df(self, jobs_df: pd.DataFrame) -> pd.DataFrame:
+    def prepare_jobs_analysis_df(
+        self, jobs_df: pd.DataFrame, as_of: pd.Timestamp = None
+    ) -> pd.DataFrame:
         """
         準備具有標準化列名和計算字段的職缺分析DataFrame。
 
         參數:
             jobs_df: 包含原始職缺數據的DataFrame
+            as_of: 計算在架天數的基準日期，預設為今天零時
 
         返回:
             具有標準化列用於分析的DataFrame
         """
-        return prepare_jobs_analysis_df(jobs_df)
+        if as_of is None:
+            as_of = pd.Timestamp.now().normalize()
+        return _cached_prepare_jobs_analysis_df(
+            jobs_fingerprint(jobs_df), as_of, jobs_df
+        )
 
     def extract_application_counts(self, jobs_analysis: pd.DataFrame) -> pd.DataFrame:
         """
@@ -225,7 +391,9 @@ class JobDataAnalyzer:
         返回:
             添加了應徵人數列的DataFrame
         """
-        return extract_application_counts(jobs_analysis)
+        return _cached_extract_application_counts(
+            jobs_fingerprint(jobs_analysis), jobs_analysis
+        )
 
     def extract_salary_range(self, jobs_analysis: pd.DataFrame) -> pd.DataFrame:
         """
@@ -237,7 +405,9 @@ class JobDataAnalyzer:
         返回:
             添加了薪資範圍列的DataFrame
         """
-        return extract_salary_range(jobs_analysis)
+        return _cached_extract_salary_range(
+            jobs_fingerprint(jobs_analysis), jobs_analysis
+        )
 
     def analyze_industry_distribution(self, jobs_df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -249,7 +419,7 @@ class JobDataAnalyzer:
         返回:
             包含產業分佈統計的DataFrame
         """
-        return analyze_industry_distribution(jobs_df)
+        return _cached_analyze_industry_distribution(jobs_fingerprint(jobs_df), jobs_df)
 
     def get_job_display_columns(self, df: pd.DataFrame = None) -> List[str]:
         """
@@ -42,8 +42,11 @@ analyzer.close()
 ```
 """
 
+from typing import Tuple
+
 import numpy as np
 import pandas as pd
+from pandas.core.groupby import DataFrameGroupBy
 
 from config.settings import logger
 
@@ -98,6 +101,7 @@ class TrendAnalyzer:
         jobs_df: pd.DataFrame,
         date_column: str = "appearDate",
         date_format: str = "%Y%m%d",
+        grouped: DataFrameGroupBy = None,
     ) -> pd.DataFrame:
         """
         分析每日職缺新增和減少情況。
@@ -106,16 +110,19 @@ class TrendAnalyzer:
             jobs_df: 包含職缺數據的DataFrame。
             date_column: 日期列的名稱。默認為'appearDate'。
             date_format: 日期格式。默認為'%Y%m%d'。
+            grouped: 已按appear_date分組的結果。提供時不再重新轉換日期和分組。
 
         返回:
             pd.DataFrame: 包含每日職缺變化分析的DataFrame。
         """
         logger.info("開始分析每日職缺變化")
 
-        # 將日期欄位轉換為日期格式
-        jobs_df["appear_date"] = pd.to_datetime(
-            jobs_df[date_column], format=date_format
-        )
+        if grouped is None:
+            # 將日期欄位轉換為日期格式
+            jobs_df["appear_date"] = pd.to_datetime(
+                jobs_df[date_column], format=date_format
+            )
+            grouped = jobs_df.groupby("appear_date")
 
         # 創建日期範圍（從最早的appear_date到最晚的appear_date或delisted_date）
         min_date = jobs_df["appear_date"].min()
@@ -140,20 +147,18 @@ class TrendAnalyzer:
         daily_jobs = pd.DataFrame({"appear_date": date_range})
 
         # 計算每天新增的職缺數量（以appearDate為準）
-        new_jobs_by_date = (
-            jobs_df.groupby("appear_date").size().reset_index(name="new_jobs")
-        )
+        new_jobs_by_date = grouped.size().reset_index(name="new_jobs")
         daily_jobs = daily_jobs.merge(new_jobs_by_date, on="appear_date", how="left")
 
         # 計算每天減少的職缺數量（以delisted_date為準）
         if "delisted_date" in jobs_df.columns:
-            # 只考慮有效的delisted_date
-            valid_delisted = jobs_df[jobs_df["delisted_date"].notna()]
-            if not valid_delisted.empty:
-                removed_jobs_by_date = (
-                    valid_delisted.groupby("delisted_date")
-                    .size()
-                    .reset_index(name="removed_jobs")
+            # 只考慮有效的delisted_date，直接在日期數組上計數，不複製整個DataFrame
+            delisted_dates = jobs_df["delisted_date"].to_numpy()
+            delisted_dates = delisted_dates[~np.isnat(delisted_dates)]
+            if len(delisted_dates) > 0:
+                dates, counts = np.unique(delisted_dates, return_counts=True)
+                removed_jobs_by_date = pd.DataFrame(
+                    {"delisted_date": dates, "removed_jobs": counts}
                 )
                 daily_jobs = daily_jobs.merge(
                     removed_jobs_by_date,
@@ -163,20 +168,26 @@ class TrendAnalyzer:
                 )
                 daily_jobs.drop("delisted_date", axis=1, inplace=True, errors="ignore")
 
-        # 填充缺失值為0
-        daily_jobs["new_jobs"] = daily_jobs["new_jobs"].fillna(0)
+        # 填充缺失值為0，並將每日計數壓縮為int32：合併後的float64欄位在日歷、
+        # 圖表和加總中被反覆掃描，使用有號整數以免新增減去減少時發生無號溢位
+        daily_jobs["new_jobs"] = daily_jobs["new_jobs"].fillna(0).astype(np.int32)
         if "removed_jobs" not in daily_jobs.columns:
-            daily_jobs["removed_jobs"] = 0
+            daily_jobs["removed_jobs"] = np.int32(0)
         else:
-            daily_jobs["removed_jobs"] = daily_jobs["removed_jobs"].fillna(0)
+            daily_jobs["removed_jobs"] = (
+                daily_jobs["removed_jobs"].fillna(0).astype(np.int32)
+            )
 
         # 按日期排序
         daily_jobs = daily_jobs.sort_values("appear_date")
 
         # 計算每天的職缺總數（累計新增減去累計減少）
-        daily_jobs["jobNo"] = (
-            daily_jobs["new_jobs"].cumsum() - daily_jobs["removed_jobs"].cumsum()
-        )
+        new_counts = daily_jobs["new_jobs"].to_numpy(np.int64)
+        removed_counts = daily_jobs["removed_jobs"].to_numpy(np.int64)
+        daily_jobs["jobNo"] = np.cumsum(new_counts) - np.cumsum(removed_counts)
+
+        # 每日淨變化，與其他計數一起計算，顯示層直接讀取
+        daily_jobs["net_jobs"] = (new_counts - removed_counts).astype(np.int32)
 
         # 計算變化率
         daily_jobs["new_delta"] = daily_jobs["new_jobs"].diff()
@@ -190,6 +201,7 @@ class TrendAnalyzer:
         jobs_df: pd.DataFrame,
         date_column: str = "appearDate",
         date_format: str = "%Y%m%d",
+        grouped: DataFrameGroupBy = None,
     ) -> pd.DataFrame:
         """
         按日期分析職缺詳細信息，包括新增和減少的具體職缺。
@@ -198,16 +210,19 @@ class TrendAnalyzer:
             jobs_df: 包含職缺數據的DataFrame。
             date_column: 日期列的名稱。默認為'appearDate'。
             date_format: 日期格式。默認為'%Y%m%d'。
+            grouped: 已按appear_date分組的結果。提供時不再重新轉換日期和分組。
 
         返回:
             pd.DataFrame: 包含每日職缺詳細變化的DataFrame。
         """
         logger.info("開始按日期分析職缺詳細信息")
 
-        # 將日期欄位轉換為日期格式
-        jobs_df["appear_date"] = pd.to_datetime(
-            jobs_df[date_column], format=date_format
-        )
+        if grouped is None:
+            # 將日期欄位轉換為日期格式
+            jobs_df["appear_date"] = pd.to_datetime(
+                jobs_df[date_column], format=date_format
+            )
+            grouped = jobs_df.groupby("appear_date")
 
         # 準備要聚合的列
         agg_dict = {
@@ -226,17 +241,44 @@ class TrendAnalyzer:
             agg_dict["district"] = list
 
         # 按日期分組計算每天的職缺數，並保存職位名稱、公司名稱、URL、城市和地區
-        daily_jobs = jobs_df.groupby("appear_date").agg(agg_dict).reset_index()
+        daily_jobs = grouped.agg(agg_dict).reset_index()
 
         daily_jobs = daily_jobs.sort_values("appear_date")
 
         # 計算每天的總職缺數和變化
-        daily_jobs["total_count"] = daily_jobs["jobNo"]
+        daily_jobs["total_count"] = daily_jobs["jobNo"].astype(np.int32)
         daily_jobs["count_diff"] = daily_jobs["jobNo"].diff()
 
         logger.info(f"成功分析每日職缺詳細信息，共{len(daily_jobs)}天的數據")
         return daily_jobs
 
+    def analyze_daily_changes_and_details(
+        self,
+        jobs_df: pd.DataFrame,
+        date_column: str = "appearDate",
+        date_format: str = "%Y%m%d",
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        同時計算每日職缺變化和按日期的職缺詳細信息，日期只轉換一次，分組結果共用。
+
+        參數:
+            jobs_df: 包含職缺數據的DataFrame。
+            date_column: 日期列的名稱。默認為'appearDate'。
+            date_format: 日期格式。默認為'%Y%m%d'。
+
+        返回:
+            Tuple[pd.DataFrame, pd.DataFrame]: (每日職缺變化, 每日職缺詳細變化)
+        """
+        # 將日期欄位轉換為日期格式
+        jobs_df["appear_date"] = pd.to_datetime(
+            jobs_df[date_column], format=date_format
+        )
+        grouped = jobs_df.groupby("appear_date")
+
+        daily_jobs = self.analyze_daily_job_changes(jobs_df, grouped=grouped)
+        job_details = self.analyze_job_details_by_date(jobs_df, grouped=grouped)
+        return daily_jobs, job_details
+
     def analyze_industry_distribution(
         self, jobs_df: pd.DataFrame, industry_column: str = "coIndustryDesc"
     ) -> pd.DataFrame:
@@ -286,19 +328,22 @@ class TrendAnalyzer:
         """
         logger.info("開始按產業和月份分析職缺趨勢")
 
-        # 將日期轉換為月份格式
-        jobs_df["month"] = pd.to_datetime(
-            jobs_df[date_column], format=date_format
-        ).dt.strftime("%Y-%m")
-
-        # 按產業和月份統計職缺
-        monthly_industry_stats = jobs_df.pivot_table(
-            values="jobNo",
-            index=industry_column,
-            columns="month",
-            aggfunc="count",
-            fill_value=0,
-        ).reset_index()
+        # 將日期轉換為月份（Period），不在傳入的DataFrame上新增欄位
+        months = pd.to_datetime(jobs_df[date_column], format=date_format).dt.to_period(
+            "M"
+        )
+
+        # 按產業和月份統計職缺（groupby + count + unstack，避免pivot_table的額外開銷），
+        # 月份標籤只在聚合後對少量欄位格式化一次
+        monthly_industry_stats = (
+            jobs_df.groupby([jobs_df[industry_column], months])["jobNo"]
+            .count()
+            .unstack(fill_value=0)
+        )
+        monthly_industry_stats.columns = monthly_industry_stats.columns.strftime(
+            "%Y-%m"
+        )
+        monthly_industry_stats = monthly_industry_stats.reset_index()
 
         monthly_industry_stats.columns.name = None
         monthly_industry_stats = monthly_industry_stats.rename(
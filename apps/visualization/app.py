@@ -117,7 +117,7 @@ def handle_page_navigation(
     # 頁面映射表，將頁面名稱映射到對應的處理函數
     page_handlers = {
         "總覽 Dashboard": lambda: show_dashboard_page(
-            job_data_analyzer, keywords, city, district, limit, months
+            job_data_analyzer, trend_analyzer, keywords, city, district, limit, months
         ),
         "每日職缺變化分析": lambda: show_daily_changes_page(
             job_data_analyzer, trend_analyzer, keywords, city, district, limit, months
@@ -136,7 +136,12 @@ def handle_page_navigation(
     # 記錄用戶選擇的頁面
     logger.info(f"用戶選擇頁面: {page}")
     logger.debug(
-        f"頁面參數 - 關鍵詞: {keywords}, 城市: {city}, 地區: {district}, 限制: {limit}, 月份: {months}"
+        "頁面參數 - 關鍵詞: %s, 城市: %s, 地區: %s, 限制: %s, 月份: %s",
+        keywords,
+        city,
+        district,
+        limit,
+        months,
     )
 
     # 調用對應的頁面處理函數
@@ -32,5 +32,6 @@ def display_filter_info(keywords, city, district, months):
         filter_info.append(f"最近 {months} 個月")
 
     if filter_info:
-        logger.debug(f"過濾條件: {', '.join(filter_info)}")
-        st.info(f"正在分析符合以下條件的職缺: {', '.join(filter_info)}")
+        filter_text = ", ".join(filter_info)
+        logger.debug("過濾條件: %s", filter_text)
+        st.info(f"正在分析符合以下條件的職缺: {filter_text}")
@@ -9,12 +9,31 @@
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import streamlit as st
 
 from config.settings import logger
 
+# 默認技術堆棧
+DEFAULT_TECH_STACK = ("Python", "DuckDB", "Streamlit", "Pandas", "Plotly")
+
+
+@st.cache_data(show_spinner=False)
+def _tech_stack_column_markdown(tech_stack: Tuple[str, ...]) -> Tuple[str, str]:
+    """
+    將技術堆棧交錯分成兩列，並預先組合成每列一段的Markdown列表。
+
+    參數:
+        tech_stack: 技術堆棧元組
+
+    返回:
+        Tuple[str, str]: 左右兩列的Markdown文字
+    """
+    left = "\n".join(f"- {tech}" for tech in tech_stack[0::2])
+    right = "\n".join(f"- {tech}" for tech in tech_stack[1::2])
+    return left, right
+
 
 def create_tech_stack_info(tech_stack: Optional[List[str]] = None) -> None:
     """
@@ -24,15 +43,16 @@ def create_tech_stack_info(tech_stack: Optional[List[str]] = None) -> None:
         tech_stack: 技術堆棧列表，如果為None則使用默認列表
     """
     if tech_stack is None:
-        tech_stack = ["Python", "DuckDB", "Streamlit", "Pandas", "Plotly"]
+        tech_stack = DEFAULT_TECH_STACK
 
     # 使用更美觀的方式顯示技術堆棧
     st.sidebar.markdown("### 技術堆棧")
 
-    # 將技術堆棧分成兩列顯示
+    # 將技術堆棧分成兩列顯示，每列只寫入一段預先組合的Markdown
     cols = st.sidebar.columns(2)
-    for i, tech in enumerate(tech_stack):
-        cols[i % 2].markdown(f"- {tech}")
+    for col, markdown in zip(cols, _tech_stack_column_markdown(tuple(tech_stack))):
+        if markdown:
+            col.markdown(markdown)
 
     st.sidebar.info("本平台提供對 104 職缺數據的深入分析與視覺化。")
 
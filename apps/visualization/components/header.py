@@ -15,6 +15,15 @@ import streamlit as st
 
 from config.settings import logger
 
+# 頁面對應的子標題
+_PAGE_SUBHEADERS = {
+    "總覽 Dashboard": "市場概況與關鍵指標",
+    "每日職缺變化分析": "職缺數量變化趨勢與分析",
+    "產業職缺分佈與趨勢": "各產業職缺分佈與發展趨勢",
+    "招聘效率分析": "企業招聘流程效率指標",
+    "薪資與地區分析": "各地區與職位薪資水平比較",
+}
+
 
 def create_title(title: str = "📊 104 職缺市場洞察平台") -> None:
     """
@@ -48,28 +57,30 @@ def create_subheader(page: str) -> None:
     參數:
         page: 當前頁面名稱
     """
-    # 頁面對應的子標題
-    page_subheaders = {
-        "總覽 Dashboard": "市場概況與關鍵指標",
-        "每日職缺變化分析": "職缺數量變化趨勢與分析",
-        "產業職缺分佈與趨勢": "各產業職缺分佈與發展趨勢",
-        "招聘效率分析": "企業招聘流程效率指標",
-        "薪資與地區分析": "各地區與職位薪資水平比較",
-    }
-
     # 獲取當前頁面的子標題
-    subheader = page_subheaders.get(page, "")
+    subheader = _PAGE_SUBHEADERS.get(page, "")
 
     if subheader:
         st.subheader(subheader)
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _last_updated() -> str:
+    """
+    獲取格式化的最後更新時間，快取60秒，避免每次重新執行都重新取得並格式化時間。
+
+    返回:
+        str: 格式化的時間字符串
+    """
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
 def create_last_updated_info() -> None:
     """
     創建最後更新時間信息。
     """
-    # 獲取當前時間作為最後更新時間
-    last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # 獲取最後更新時間（每分鐘更新一次）
+    last_updated = _last_updated()
 
     # 在右側顯示最後更新時間
     col1, col2 = st.columns([3, 1])
@@ -127,7 +138,7 @@ def create_header(
         # 創建幫助按鈕
         create_help_button()
 
-        logger.debug(f"創建頁面標題: {title}, 頁面: {page}")
+        logger.debug("創建頁面標題: %s, 頁面: %s", title, page)
     except Exception as e:
         logger.error(f"創建頁面標題時發生錯誤: {str(e)}", exc_info=True)
         st.error("載入頁面標題時發生錯誤。")
@@ -8,12 +8,119 @@
 版本: 1.0.0
 """
 
-from typing import Any, Dict, List, Optional, Union
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import streamlit as st
 
 from config.settings import logger
 
+# 頁面選項和對應的圖標
+_PAGE_OPTIONS = (
+    "總覽 Dashboard",
+    "每日職缺變化分析",
+    "產業職缺分佈與趨勢",
+    "招聘效率分析",
+    "薪資與地區分析",
+)
+
+_PAGE_ICONS = {
+    "總覽 Dashboard": "📊",
+    "每日職缺變化分析": "📈",
+    "產業職缺分佈與趨勢": "🏢",
+    "招聘效率分析": "⏱️",
+    "薪資與地區分析": "💰",
+}
+
+# 時間範圍選項（月）對應的顯示文字
+_MONTHS_LABELS = {
+    None: "全部時間",
+    1: "最近1個月",
+    3: "最近3個月",
+    6: "最近6個月",
+    12: "最近12個月",
+}
+_MONTHS_OPTIONS = tuple(_MONTHS_LABELS)
+
+# 頁面的簡短說明
+_PAGE_DESCRIPTIONS = {
+    "總覽 Dashboard": "查看職缺市場的整體概況和關鍵指標",
+    "每日職缺變化分析": "分析職缺數量的每日變化趨勢",
+    "產業職缺分佈與趨勢": "探索不同產業的職缺分佈和發展趨勢",
+    "招聘效率分析": "分析企業招聘流程的效率指標",
+    "薪資與地區分析": "比較不同地區和職位的薪資水平",
+}
+
+
+@st.cache_data(show_spinner=False)
+def _prepare_districts(
+    taiwan_city_items: Tuple[Tuple[str, Tuple[str, ...]], ...],
+) -> Tuple[List[str], Dict[str, List[str]], List[str]]:
+    """
+    準備城市和地區選項，包括排序後的城市、各城市排序後的地區以及所有地區的聯集。
+
+    城市資料在每次重新執行時都不變，因此結果只需計算一次。
+
+    參數:
+        taiwan_city_items: 可哈希的城市與地區資料，格式為((城市, (地區, ...)), ...)
+
+    返回:
+        Tuple: (排序後的城市列表, 城市到排序後地區的映射, 排序後的所有地區列表)
+    """
+    cities = sorted(city for city, _ in taiwan_city_items)
+    districts_by_city = {
+        city: sorted(districts) for city, districts in taiwan_city_items
+    }
+    union_districts = sorted(
+        set().union(*(districts for _, districts in taiwan_city_items))
+    )
+    return cities, districts_by_city, union_districts
+
+
+@st.cache_resource(show_spinner=False)
+def _build_keyword_index(
+    keywords_choices: Tuple[str, ...],
+) -> Tuple[List[str], Dict[str, List[Tuple[int, str]]]]:
+    """
+    建立關鍵詞前綴索引，只在關鍵詞列表變化時建立一次。
+
+    參數:
+        keywords_choices: 可用的關鍵詞元組
+
+    返回:
+        Tuple: (排序後的小寫關鍵詞列表, 小寫關鍵詞到[(原始位置, 原始關鍵詞)]的映射)
+    """
+    originals: Dict[str, List[Tuple[int, str]]] = {}
+    for position, keyword in enumerate(keywords_choices):
+        originals.setdefault(keyword.lower(), []).append((position, keyword))
+    return sorted(originals), originals
+
+
+def _suggest_keywords(
+    keywords_choices: List[str], prefix: str, max_hits: int = 5
+) -> List[str]:
+    """
+    以二分搜尋在排序後的小寫關鍵詞列表中查找符合前綴的建議。
+
+    參數:
+        keywords_choices: 可用的關鍵詞列表
+        prefix: 用戶當前輸入的小寫前綴
+        max_hits: 最多返回的建議數量
+
+    返回:
+        List[str]: 符合前綴的原始關鍵詞，保持在keywords_choices中的順序
+    """
+    sorted_lower, originals = _build_keyword_index(tuple(keywords_choices))
+
+    # 符合前綴的關鍵詞在排序後的列表中是連續的一段
+    hits = []
+    i = bisect_left(sorted_lower, prefix)
+    while i < len(sorted_lower) and sorted_lower[i].startswith(prefix):
+        hits.extend(originals[sorted_lower[i]])
+        i += 1
+
+    return [keyword for _, keyword in sorted(hits)[:max_hits]]
+
 
 def update_keywords(suggestion: str) -> None:
     """
@@ -23,16 +130,30 @@ def update_keywords(suggestion: str) -> None:
         suggestion: 用戶選擇的關鍵詞建議
     """
     # 獲取當前關鍵詞
-    current_keywords = st.session_state.search_keywords
+    current_keywords = st.session_state.search_keywords_input
 
     # 如果當前關鍵詞為空，直接設置為建議
     if not current_keywords:
-        st.session_state.search_keywords = suggestion
+        new_keywords = suggestion
     else:
         # 否則，替換最後一個關鍵詞為建議
         parts = current_keywords.split(",")
         parts[-1] = suggestion
-        st.session_state.search_keywords = ",".join(parts)
+        new_keywords = ",".join(parts)
+
+    # 同時更新輸入框元件的狀態，回調在重新執行前運行，輸入框會顯示新的值
+    st.session_state.search_keywords = new_keywords
+    st.session_state.search_keywords_input = new_keywords
+
+
+def apply_keyword_suggestion() -> None:
+    """
+    當用戶在建議下拉框中選擇關鍵詞時更新關鍵詞，並清空下拉框的選擇。
+    """
+    suggestion = st.session_state.kw_suggest
+    if suggestion:
+        update_keywords(suggestion)
+        st.session_state.kw_suggest = ""
 
 
 def create_keyword_filter(keywords_choices: List[str]) -> List[str]:
@@ -51,10 +172,13 @@ def create_keyword_filter(keywords_choices: List[str]) -> List[str]:
     if "search_keywords" not in st.session_state:
         st.session_state.search_keywords = ""
 
-    # 使用text_input搭配自動補全功能，並從session state獲取值
+    # 輸入框的值只由session state提供，不同時傳入value，避免重置時出現警告
+    if "search_keywords_input" not in st.session_state:
+        st.session_state.search_keywords_input = st.session_state.search_keywords
+
+    # 使用text_input搭配自動補全功能
     search_keywords = st.sidebar.text_input(
         "關鍵詞 (可輸入多個，用逗號分隔)",
-        value=st.session_state.search_keywords,
         key="search_keywords_input",
         help="留空表示搜尋全部關鍵詞，輸入時會自動提示可用的關鍵詞",
     )
@@ -68,21 +192,18 @@ def create_keyword_filter(keywords_choices: List[str]) -> List[str]:
         current_input = search_keywords.split(",")[-1].strip().lower()
 
         if current_input:
-            # 過濾出符合當前輸入的關鍵詞建議
-            suggestions = [
-                k for k in keywords_choices if k.lower().startswith(current_input)
-            ]
+            # 過濾出符合當前輸入的關鍵詞建議（限制顯示前5個建議）
+            suggestions = _suggest_keywords(keywords_choices, current_input)
 
             if suggestions:
-                st.sidebar.caption("建議的關鍵詞:")
-                for suggestion in suggestions[:5]:  # 限制顯示前5個建議
-                    if st.sidebar.button(
-                        suggestion,
-                        key=f"suggest_{suggestion}",
-                        on_click=update_keywords,
-                        args=(suggestion,),
-                    ):
-                        pass  # 按鈕點擊時會調用update_keywords函數
+                # 使用單一下拉框列出所有建議，選擇時會調用apply_keyword_suggestion函數
+                st.sidebar.selectbox(
+                    "建議的關鍵詞:",
+                    [""] + suggestions,
+                    key="kw_suggest",
+                    format_func=lambda k: k if k else "請選擇建議的關鍵詞",
+                    on_change=apply_keyword_suggestion,
+                )
 
     # 顯示所有可用的關鍵詞
     with st.sidebar.expander("查看所有可用的關鍵詞"):
@@ -105,7 +226,8 @@ def create_limit_filter() -> Union[str, int]:
         Union[str, int]: 用戶選擇的數據限制
     """
     limit_options = ["無限制", 1000, 5000, 10000, 20000]
-    limit = st.sidebar.selectbox("最大獲取職缺數量", limit_options, index=0)
+    # 使用st.selectbox而非st.sidebar.selectbox，讓元件渲染在所屬的容器（表單）中
+    limit = st.selectbox("最大獲取職缺數量", limit_options, index=0)
     return limit
 
 
@@ -116,17 +238,12 @@ def create_time_filter() -> Optional[int]:
     返回:
         Optional[int]: 用戶選擇的時間範圍（月），如果選擇全部時間則為None
     """
-    months_options = [
-        ("全部時間", None),
-        ("最近1個月", 1),
-        ("最近3個月", 3),
-        ("最近6個月", 6),
-        ("最近12個月", 12),
-    ]
-    selected_months = st.sidebar.selectbox(
-        "時間範圍", options=[label for label, _ in months_options], index=0
+    months = st.selectbox(
+        "時間範圍",
+        options=_MONTHS_OPTIONS,
+        format_func=_MONTHS_LABELS.__getitem__,
+        index=0,
     )
-    months = dict(months_options)[selected_months]
     return months
 
 
@@ -147,7 +264,7 @@ def create_location_filter(
     selected_city = st.sidebar.selectbox(
         "選擇城市進行分析", ["全部城市"] + cities, key="sidebar_city"
     )
-    logger.debug(f"用戶選擇的城市: {selected_city}")
+    logger.debug("用戶選擇的城市: %s", selected_city)
 
     # 根據選擇的城市獲取對應的地區列表
     districts = all_districts.get(selected_city, [])
@@ -156,7 +273,7 @@ def create_location_filter(
     selected_district = st.sidebar.selectbox(
         "選擇地區進行分析", ["全部地區"] + districts, key="sidebar_district"
     )
-    logger.debug(f"用戶選擇的地區: {selected_district}")
+    logger.debug("用戶選擇的地區: %s", selected_district)
 
     # 根據選擇設置城市和地區變數
     city = None if selected_city == "全部城市" else selected_city
@@ -174,44 +291,15 @@ def create_page_navigation() -> str:
     """
     st.sidebar.title("導覽")
 
-    # 定義頁面選項和對應的圖標
-    page_options = [
-        "總覽 Dashboard",
-        "每日職缺變化分析",
-        "產業職缺分佈與趨勢",
-        "招聘效率分析",
-        "薪資與地區分析",
-    ]
-
-    page_icons = {
-        "總覽 Dashboard": "📊",
-        "每日職缺變化分析": "📈",
-        "產業職缺分佈與趨勢": "🏢",
-        "招聘效率分析": "⏱️",
-        "薪資與地區分析": "💰",
-    }
-
-    # 使用帶有圖標的選項
-    page_display_options = [f"{page_icons[page]} {page}" for page in page_options]
-
-    # 創建帶有圖標的頁面選擇器
-    selected_page_with_icon = st.sidebar.radio(
-        "請選擇分析頁面", page_display_options, format_func=lambda x: x
+    # 創建帶有圖標的頁面選擇器，選項本身就是頁面名稱，圖標只在顯示時加上
+    selected_page = st.sidebar.radio(
+        "請選擇分析頁面",
+        _PAGE_OPTIONS,
+        format_func=lambda page: f"{_PAGE_ICONS[page]} {page}",
     )
 
-    # 提取頁面名稱（去除圖標）
-    selected_page = selected_page_with_icon[2:].strip()
-
     # 顯示當前頁面的簡短說明
-    page_descriptions = {
-        "總覽 Dashboard": "查看職缺市場的整體概況和關鍵指標",
-        "每日職缺變化分析": "分析職缺數量的每日變化趨勢",
-        "產業職缺分佈與趨勢": "探索不同產業的職缺分佈和發展趨勢",
-        "招聘效率分析": "分析企業招聘流程的效率指標",
-        "薪資與地區分析": "比較不同地區和職位的薪資水平",
-    }
-
-    st.sidebar.info(page_descriptions[selected_page])
+    st.sidebar.info(_PAGE_DESCRIPTIONS[selected_page])
 
     return selected_page
 
@@ -236,41 +324,31 @@ def display_filter_summary(
     # 顯示當前過濾條件摘要
     st.sidebar.title("當前過濾條件")
 
-    if keywords:
-        st.sidebar.write(f"關鍵詞: {', '.join(keywords)}")
-    else:
-        st.sidebar.write("關鍵詞: 全部")
-
-    if city:
-        st.sidebar.write(f"城市: {city}")
-    else:
-        st.sidebar.write("城市: 全部")
-
-    if district:
-        st.sidebar.write(f"地區: {district}")
-    else:
-        st.sidebar.write("地區: 全部")
-
-    if months:
-        st.sidebar.write(f"時間範圍: 最近{months}個月")
-    else:
-        st.sidebar.write("時間範圍: 全部時間")
+    summary = "\n".join(
+        [
+            f"- 關鍵詞: {', '.join(keywords) if keywords else '全部'}",
+            f"- 城市: {city or '全部'}",
+            f"- 地區: {district or '全部'}",
+            f"- 時間範圍: {f'最近{months}個月' if months else '全部時間'}",
+            f"- 最大獲取職缺數量: {limit}",
+        ]
+    )
 
-    st.sidebar.write(f"最大獲取職缺數量: {limit}")
+    # 以單一Markdown區塊顯示所有過濾條件
+    st.sidebar.markdown(summary)
 
 
 def reset_filters():
     """
     重置所有過濾條件到默認值。
+
+    作為按鈕的on_click回調執行，回調在腳本重新執行之前運行，
+    因此直接重置元件的session state即可，不需要再調用st.rerun()觸發第二次完整重新執行。
     """
-    if "search_keywords" in st.session_state:
-        st.session_state.search_keywords = ""
-    if "sidebar_city" in st.session_state:
-        st.session_state.sidebar_city = "全部城市"
-    if "sidebar_district" in st.session_state:
-        st.session_state.sidebar_district = "全部地區"
-    # 重置其他過濾器的session state
-    st.session_state.filter_reset = True
+    st.session_state.search_keywords = ""
+    st.session_state.search_keywords_input = ""
+    st.session_state.sidebar_city = "全部城市"
+    st.session_state.sidebar_district = "全部地區"
 
 
 def create_sidebar(
@@ -287,10 +365,6 @@ def create_sidebar(
         Dict[str, Any]: 包含所有側邊欄選擇的字典
     """
     try:
-        # 初始化重置標誌
-        if "filter_reset" not in st.session_state:
-            st.session_state.filter_reset = False
-
         # 創建過濾器標題和重置按鈕
         col1, col2 = st.sidebar.columns([3, 1])
         with col1:
@@ -302,32 +376,26 @@ def create_sidebar(
         keywords = create_keyword_filter(keywords_choices)
 
         # 創建高級過濾器的可折疊部分
+        # 使用表單批次提交：調整多個選項只在點擊"套用"時重新執行一次，
+        # 未提交前表單內元件返回上次提交的值
         with st.sidebar.expander("高級過濾選項", expanded=False):
-            # 創建數據限制過濾器
-            limit = create_limit_filter()
-
-            # 創建時間範圍過濾器
-            months = create_time_filter()
-
-        # 使用傳入的台灣城市數據
-        cities = sorted(list(taiwan_city.keys()))
-        all_districts = {}
-
-        # 為每個城市獲取地區
-        for city, districts in taiwan_city.items():
-            all_districts[city] = sorted(districts)
-
-        # 獲取所有地區（用於"全部城市"選項）
-        all_districts["全部城市"] = sorted(
-            list(
-                {
-                    district
-                    for districts in taiwan_city.values()
-                    for district in districts
-                }
-            )
+            with st.form("advanced_filters", clear_on_submit=False):
+                # 創建數據限制過濾器
+                limit = create_limit_filter()
+
+                # 創建時間範圍過濾器
+                months = create_time_filter()
+
+                st.form_submit_button("套用")
+
+        # 使用傳入的台灣城市數據，排序結果由快取提供
+        cities, districts_by_city, union_districts = _prepare_districts(
+            tuple((city, tuple(districts)) for city, districts in taiwan_city.items())
         )
 
+        # 為每個城市獲取地區，並加入所有地區（用於"全部城市"選項）
+        all_districts = {**districts_by_city, "全部城市": union_districts}
+
         # 創建位置過濾器
         city, district = create_location_filter(cities, all_districts)
 
@@ -337,11 +405,6 @@ def create_sidebar(
         # 顯示過濾條件摘要
         display_filter_summary(keywords, city, district, months, limit)
 
-        # 如果過濾器被重置，清除重置標誌
-        if st.session_state.filter_reset:
-            st.session_state.filter_reset = False
-            st.rerun()
-
         # 返回所有側邊欄選擇
         return {
             "keywords": keywords,
@@ -3,21 +3,43 @@ Daily changes page for the 104 Job Insight visualization app.
 This page analyzes the daily changes in job listings, showing trends and detailed changes.
 """
 
-from datetime import datetime
-from typing import Callable, List, Optional
+import logging
+from datetime import date, datetime
+from typing import Callable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
 from apps.visualization.analysis.df_utils import (
     get_job_display_columns,
+    jobs_fingerprint,
+    lttb_downsample_indices,
     prepare_jobs_analysis_df,
 )
+from apps.visualization.analysis.job_data_analyzer import CACHE_TTL
 from apps.visualization.components import display_filter_info
 from config.settings import logger
 
 
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _encode_csv(fingerprint: tuple, selected_date: date, _df: pd.DataFrame) -> bytes:
+    """
+    以數據指紋和選定日期為鍵將DataFrame編碼為CSV位元組，重新執行時不會重複序列化，
+    也不需要對整個下載表格進行哈希。
+
+    參數:
+        fingerprint: 選定日期職缺數據的指紋
+        selected_date: 選定的日期
+        _df: 要下載的DataFrame，不參與哈希
+
+    返回:
+        bytes: 以utf-8-sig編碼的CSV內容
+    """
+    return _df.to_csv(index=False).encode("utf-8-sig")
+
+
 def display_jobs_for_selected_date(selected_date, jobs_df, trend_analyzer=None):
     """
     顯示選定日期的職缺詳情表格
@@ -44,11 +66,17 @@ def display_jobs_for_selected_date(selected_date, jobs_df, trend_analyzer=None):
 
     logger.info(f"顯示{selected_date}的新增職缺詳情")
 
-    # 將日期欄位轉換為日期格式
-    jobs_df["appear_date"] = pd.to_datetime(jobs_df["appearDate"], format="%Y%m%d")
+    # 日期欄位通常已由JobDataLoader.load_jobs預先轉換，否則在此轉換
+    if "appear_date" not in jobs_df.columns:
+        jobs_df["appear_date"] = pd.to_datetime(
+            jobs_df["appearDate"], format="%Y%m%d", cache=True
+        )
 
-    # 篩選選定日期的職缺
-    selected_jobs = jobs_df[jobs_df["appear_date"].dt.date == selected_date]
+    # 篩選選定日期的職缺，直接在datetime64數組上按日比較
+    mask = jobs_df["appear_date"].to_numpy().astype("datetime64[D]") == np.datetime64(
+        selected_date, "D"
+    )
+    selected_jobs = jobs_df[mask]
 
     if selected_jobs.empty:
         logger.warning(f"{selected_date}沒有新增職缺")
@@ -87,8 +115,10 @@ def display_jobs_for_selected_date(selected_date, jobs_df, trend_analyzer=None):
     st.markdown("### 職缺詳細資料")
 
     # 顯示職缺表格 - 使用與dashboard_page相同的配置
+    # 只渲染前MAX_TABLE_ROWS行，避免每次重新運行都序列化並傳送整個表格
+    display_df = jobs_analysis[display_cols]
     st.dataframe(
-        jobs_analysis[display_cols],
+        display_df.head(MAX_TABLE_ROWS),
         column_config={
             "連結": st.column_config.LinkColumn(
                 "連結", display_text="開啟連結", width="small"
@@ -103,8 +133,13 @@ def display_jobs_for_selected_date(selected_date, jobs_df, trend_analyzer=None):
         hide_index=True,
     )
 
+    if len(display_df) > MAX_TABLE_ROWS:
+        st.caption(
+            f"顯示前 {MAX_TABLE_ROWS} / {len(display_df)} 筆，請使用 CSV 下載取得完整資料"
+        )
+
     # 提供下載選項 - 美化下載按鈕
-    csv = jobs_analysis[display_cols].to_csv(index=False).encode("utf-8-sig")
+    csv = _encode_csv(jobs_fingerprint(selected_jobs), selected_date, display_df)
 
     download_container = st.container()
     with download_container:
@@ -142,6 +177,57 @@ def display_jobs_for_selected_date(selected_date, jobs_df, trend_analyzer=None):
 DEFAULT_JOB_LIMIT = 10000
 ALL_CITIES_LABEL = "全部城市"
 ALL_DISTRICTS_LABEL = "全部地區"
+# 表格最多渲染的行數，完整數據透過CSV下載取得
+MAX_TABLE_ROWS = 500
+# 趨勢圖每條曲線最多繪製的點數，超過時以LTTB降採樣；
+# 因此無論原始數據多大，瀏覽器端的點數都有上限，不需要另外的GPU渲染路徑
+MAX_TREND_POINTS = 3000
+# 數據點超過此數量時改用WebGL繪製，點數少時SVG反而較快
+WEBGL_MIN_POINTS = 2000
+
+# 趨勢圖和詳情表格的時間聚合粒度（pandas resample頻率）及聚合方式
+AGGREGATION_PERIODS = {"原始": None, "週": "W", "月": "MS"}
+AGGREGATION_FUNCS = {"總和": "sum", "平均": "mean", "最大": "max"}
+# 查詢範圍超過此月數（或不限月數）時，默認按週聚合
+AGGREGATE_MONTHS_THRESHOLD = 6
+
+# 每日職缺變化詳情表格的顯示列及其中文名稱
+DAILY_DETAILS_COLUMNS = {
+    "appear_date": "日期",
+    "jobNo": "職缺數",
+    "new_jobs": "新增職缺",
+    "removed_jobs": "減少職缺",
+    "new_delta": "新增變化",
+    "removed_delta": "減少變化",
+}
+
+# 比較新增和減少職缺時從每日詳細數據中取出的欄位
+COMPARISON_COLUMNS = (
+    "jobName",
+    "custName",
+    "city",
+    "district",
+    "job",
+    "search_keyword",
+)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_daily_changes_and_details(
+    fingerprint: tuple, _trend_analyzer, _jobs_df: pd.DataFrame
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    以數據指紋為鍵快取每日職缺變化和按日期的職缺詳細信息。
+
+    參數:
+        fingerprint: 職缺數據的指紋
+        _trend_analyzer: TrendAnalyzer實例，使用前導下劃線告訴Streamlit不要嘗試對此參數進行哈希處理
+        _jobs_df: 職缺數據DataFrame，不參與哈希
+
+    返回:
+        Tuple[pd.DataFrame, pd.DataFrame]: (每日職缺變化數據, 每日職缺詳細變化數據)
+    """
+    return _trend_analyzer.analyze_daily_changes_and_details(_jobs_df)
 
 
 class JobDataLoader:
@@ -196,6 +282,16 @@ class JobDataLoader:
             )
             return None
 
+        # 低基數的城市和地區欄位轉換為category類型，等值比較改為整數編碼比較
+        for col in ("city", "district"):
+            if col in jobs_df.columns:
+                jobs_df[col] = jobs_df[col].astype("category")
+
+        # 預先將上架日期轉換為日期格式，供後續按日期篩選使用
+        jobs_df["appear_date"] = pd.to_datetime(
+            jobs_df["appearDate"], format="%Y%m%d", cache=True
+        )
+
         # 顯示職缺數量
         logger.info(f"找到 {len(jobs_df)} 個符合條件的職缺")
         st.write(f"找到 {len(jobs_df)} 個符合條件的職缺")
@@ -221,13 +317,23 @@ class JobDataLoader:
         )
         logger.debug(f"過濾前職缺數量: {len(jobs_df)}")
 
-        # 應用過濾條件
-        filtered_df = jobs_df.copy()
+        # 未選擇任何位置條件時直接返回，職缺數量已在載入時顯示過
+        if (
+            selected_city == ALL_CITIES_LABEL
+            and selected_district == ALL_DISTRICTS_LABEL
+        ):
+            return jobs_df
+
+        # 應用過濾條件：合併為單一布林遮罩後只索引一次，不預先複製整個DataFrame
+        # 直接在category欄位的Series上比較，走整數編碼比較，不轉回object數組
+        mask = np.ones(len(jobs_df), dtype=bool)
         if selected_city != ALL_CITIES_LABEL:
-            filtered_df = filtered_df[filtered_df["city"] == selected_city]
+            mask &= (jobs_df["city"] == selected_city).to_numpy()
 
         if selected_district != ALL_DISTRICTS_LABEL:
-            filtered_df = filtered_df[filtered_df["district"] == selected_district]
+            mask &= (jobs_df["district"] == selected_district).to_numpy()
+
+        filtered_df = jobs_df if mask.all() else jobs_df[mask]
 
         logger.debug(f"過濾後職缺數量: {len(filtered_df)}")
 
@@ -285,12 +391,15 @@ class DailyChangesAnalyzer:
         """
         self.trend_analyzer = trend_analyzer
 
-    def analyze_daily_changes(self, jobs_df: pd.DataFrame) -> None:
+    def analyze_daily_changes(
+        self, jobs_df: pd.DataFrame, months: Optional[int] = None
+    ) -> None:
         """
         分析每日職缺變化趨勢，顯示每月日歷視圖並允許點擊日期查看詳情。
 
         參數:
             jobs_df: 職缺數據DataFrame
+            months: 查詢的月份數量，用於決定趨勢圖的默認聚合粒度
         """
         # 檢查是否有日期信息
         if "appearDate" not in jobs_df.columns:
@@ -304,7 +413,10 @@ class DailyChangesAnalyzer:
         logger.debug(f"使用 {len(jobs_df)} 條職缺數據進行分析")
 
         # 獲取每日職缺變化數據
-        daily_jobs = self.trend_analyzer.analyze_daily_job_changes(jobs_df)
+        # 每日變化和每日詳細信息一次計算，詳細信息留給日期選擇器使用
+        daily_jobs, job_details = _cached_daily_changes_and_details(
+            jobs_fingerprint(jobs_df), self.trend_analyzer, jobs_df
+        )
         logger.debug(
             f"獲取到 {len(daily_jobs) if not daily_jobs.empty else 0} 條每日職缺變化數據"
         )
@@ -314,14 +426,19 @@ class DailyChangesAnalyzer:
             st.info("無法分析每日職缺變化趨勢，可能是因為數據不足。")
             return
 
-        logger.debug(
-            f"數據時間範圍: {daily_jobs['appear_date'].min() if not daily_jobs.empty else 'N/A'} 至 {daily_jobs['appear_date'].max() if not daily_jobs.empty else 'N/A'}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"數據時間範圍: {daily_jobs['appear_date'].min() if not daily_jobs.empty else 'N/A'} 至 {daily_jobs['appear_date'].max() if not daily_jobs.empty else 'N/A'}"
+            )
 
-        self._display_analysis_results(daily_jobs, jobs_df)
+        self._display_analysis_results(daily_jobs, jobs_df, job_details, months)
 
     def _display_analysis_results(
-        self, daily_jobs: pd.DataFrame, jobs_df: pd.DataFrame
+        self,
+        daily_jobs: pd.DataFrame,
+        jobs_df: pd.DataFrame,
+        job_details: Optional[pd.DataFrame] = None,
+        months: Optional[int] = None,
     ) -> None:
         """
         顯示分析結果，包括日歷視圖、趨勢圖表和詳情表格。
@@ -329,21 +446,32 @@ class DailyChangesAnalyzer:
         參數:
             daily_jobs: 每日職缺變化數據
             jobs_df: 原始職缺數據
+            job_details: 已計算的每日職缺詳細變化數據
+            months: 查詢的月份數量
         """
         # 顯示每月日歷視圖，僅顯示新增職缺，並允許點擊日期查看詳情
         display_monthly_calendar_view(daily_jobs, jobs_df)
 
+        # 趨勢圖表和詳情表格按選擇的粒度聚合，日歷仍使用每日數據
+        freq, how = select_daily_aggregation(months)
+        trend_arrays, trend_jobs = prepare_daily_display(daily_jobs, freq, how)
+
         # 顯示每日職缺變化趨勢圖表
-        display_daily_job_trend_chart(daily_jobs)
+        display_daily_job_trend_chart(trend_arrays)
 
         # 顯示每日職缺變化詳情表格
-        display_daily_job_details_table(daily_jobs)
+        display_daily_job_details_table(trend_jobs)
 
         # 提供日期選擇器進行詳細分析
-        self.provide_date_selector_for_detailed_analysis(jobs_df)
+        self.provide_date_selector_for_detailed_analysis(
+            jobs_df, job_details=job_details
+        )
 
     def provide_date_selector_for_detailed_analysis(
-        self, jobs_df, on_date_selected: Optional[Callable] = None
+        self,
+        jobs_df,
+        on_date_selected: Optional[Callable] = None,
+        job_details: Optional[pd.DataFrame] = None,
     ):
         """
         提供日期選擇器進行詳細分析
@@ -351,6 +479,7 @@ class DailyChangesAnalyzer:
         參數:
             jobs_df: 職缺數據DataFrame
             on_date_selected: 當日期被選中時的回調函數，如果為None則使用默認處理
+            job_details: 已計算的每日職缺詳細變化數據，如果為None則重新獲取
         """
         # 記錄提供日期選擇器
         logger.debug("顯示職缺詳細變化分析區塊")
@@ -358,7 +487,10 @@ class DailyChangesAnalyzer:
         logger.info("分析職缺詳細變化，提供日期選擇器")
 
         # 獲取職缺詳細變化數據
-        job_details = self.trend_analyzer.analyze_job_details_by_date(jobs_df)
+        if job_details is None:
+            _, job_details = _cached_daily_changes_and_details(
+                jobs_fingerprint(jobs_df), self.trend_analyzer, jobs_df
+            )
         logger.debug(
             f"獲取到 {len(job_details) if not job_details.empty else 0} 條職缺詳細變化數據"
         )
@@ -368,14 +500,20 @@ class DailyChangesAnalyzer:
             st.info("無法獲取職缺詳細變化數據，可能是因為數據不足。")
             return
 
-        logger.debug(
-            f"詳細數據時間範圍: {job_details['appear_date'].min().strftime('%Y-%m-%d') if not job_details.empty else 'N/A'} 至 {job_details['appear_date'].max().strftime('%Y-%m-%d') if not job_details.empty else 'N/A'}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"詳細數據時間範圍: {job_details['appear_date'].min().strftime('%Y-%m-%d') if not job_details.empty else 'N/A'} 至 {job_details['appear_date'].max().strftime('%Y-%m-%d') if not job_details.empty else 'N/A'}"
+            )
 
         # 允許用戶選擇日期
-        dates = job_details["appear_date"].dt.strftime("%Y-%m-%d").unique().tolist()
-        # 按降序排序日期，顯示最近的日期在前
-        dates.sort(reverse=True)
+        # 在時間戳上去重並按降序排序，顯示最近的日期在前，最後才格式化為字串
+        dates = (
+            job_details["appear_date"]
+            .drop_duplicates()
+            .sort_values(ascending=False)
+            .dt.strftime("%Y-%m-%d")
+            .tolist()
+        )
 
         if not dates:
             logger.warning("沒有可選的日期")
@@ -407,24 +545,25 @@ class DailyChangesAnalyzer:
         logger.debug(f"分析選定日期 {selected_date} 的詳細變化")
         logger.info(f"分析選定日期 {selected_date} 的職缺變化詳情")
 
-        # 找到選定日期和前一天的數據
-        selected_date_obj = datetime.strptime(selected_date, "%Y-%m-%d")
-        selected_idx = job_details[
-            job_details["appear_date"] == selected_date_obj
-        ].index
-        logger.debug(
-            f"選定日期索引: {selected_idx[0] if len(selected_idx) > 0 else 'N/A'}"
-        )
+        # 找到選定日期和前一天的數據：job_details按日期排序且每個日期一行，
+        # 以二分搜尋定位選定日期，前一行即為前一個有職缺的日期
+        appear_dates = job_details["appear_date"].to_numpy()
+        selected_date_obj = np.datetime64(datetime.strptime(selected_date, "%Y-%m-%d"))
+        curr_idx = int(np.searchsorted(appear_dates, selected_date_obj))
+        logger.debug("選定日期位置: %s", curr_idx)
 
-        if len(selected_idx) == 0 or selected_idx[0] <= 0:
+        if (
+            curr_idx == 0
+            or curr_idx >= len(appear_dates)
+            or appear_dates[curr_idx] != selected_date_obj
+        ):
             logger.warning(f"無法比較 {selected_date} 與前一天的數據")
             st.info(
                 f"無法比較 {selected_date} 與前一天的數據，可能是因為這是數據中的第一天。"
             )
             return
 
-        # 獲取當前和前一天的索引
-        curr_idx = selected_idx[0]
+        # 獲取當前和前一天的位置
         prev_idx = curr_idx - 1
         logger.debug(f"當前日期索引: {curr_idx}, 前一日期索引: {prev_idx}")
 
@@ -440,107 +579,79 @@ class DailyChangesAnalyzer:
             f"當前日期職缺數: {len(curr_row['jobName'])}, 前一日期職缺數: {len(prev_row['jobName'])}"
         )
 
-        # 創建數據框
-        curr_df, prev_df = self.create_job_dataframes(curr_row, prev_row)
+        # 取出當前和前一天的職缺數組及複合鍵
+        curr_jobs, curr_keys = self.create_job_arrays(curr_row)
+        prev_jobs, prev_keys = self.create_job_arrays(prev_row)
 
         # 計算新增和減少的職缺
-        new_job_keys, removed_job_keys = self.calculate_job_changes(curr_df, prev_df)
+        new_mask, removed_mask = self.calculate_job_changes(curr_keys, prev_keys)
 
         # 顯示結果
         self.display_job_change_results(
             curr_date,
             curr_idx,
             job_details,
-            new_job_keys,
-            removed_job_keys,
-            curr_df,
-            prev_df,
+            {col: values[new_mask] for col, values in curr_jobs.items()},
+            {col: values[removed_mask] for col, values in prev_jobs.items()},
         )
 
-    def create_job_dataframes(self, curr_row, prev_row):
+    def create_job_arrays(self, row):
         """
-        創建當前和前一天的職缺數據框
+        從某一日期的數據行取出比較用的職缺數組和複合鍵
 
         參數:
-            curr_row: 當前日期的數據行
-            prev_row: 前一日期的數據行
+            row: 某一日期的數據行
 
         返回:
-            curr_df: 當前日期的職缺數據框
-            prev_df: 前一日期的職缺數據框
+            jobs: 欄位名稱到numpy數組的字典
+            composite_keys: 以職缺名稱和公司名稱組成的複合鍵數組
         """
-        # 記錄創建數據框
-        logger.debug("創建當前和前一天的職缺數據框")
-
-        # 從行數據創建數據框
-        curr_df = pd.DataFrame(
-            {
-                "職缺名稱": curr_row["jobName"],
-                "公司名稱": curr_row["custName"],
-                "城市": curr_row["city"],
-                "地區": curr_row["district"],
-                "job": curr_row["job"],
-                "search_keyword": curr_row["search_keyword"],
-            }
-        )
+        # 記錄取出數組
+        logger.debug("取出比較用的職缺數組")
 
-        prev_df = pd.DataFrame(
-            {
-                "職缺名稱": prev_row["jobName"],
-                "公司名稱": prev_row["custName"],
-                "城市": prev_row["city"],
-                "地區": prev_row["district"],
-                "job": prev_row["job"],
-                "search_keyword": prev_row["search_keyword"],
-            }
-        )
+        # 行中的列表直接轉為numpy數組，不構造DataFrame
+        jobs = {col: np.asarray(row[col], dtype=object) for col in COMPARISON_COLUMNS}
 
         # 創建複合鍵
-        curr_df["composite_key"] = curr_df["職缺名稱"] + "|" + curr_df["公司名稱"]
-        prev_df["composite_key"] = prev_df["職缺名稱"] + "|" + prev_df["公司名稱"]
+        composite_keys = np.char.add(
+            np.char.add(jobs["jobName"].astype(str), "|"),
+            jobs["custName"].astype(str),
+        )
 
-        return curr_df, prev_df
+        return jobs, composite_keys
 
-    def calculate_job_changes(self, curr_df, prev_df):
+    def calculate_job_changes(self, curr_keys, prev_keys):
         """
         計算新增和減少的職缺
 
         參數:
-            curr_df: 當前日期的職缺數據框
-            prev_df: 前一日期的職缺數據框
+            curr_keys: 當前日期職缺的複合鍵數組
+            prev_keys: 前一日期職缺的複合鍵數組
 
         返回:
-            new_job_keys: 新增職缺的鍵集合
-            removed_job_keys: 減少職缺的鍵集合
+            new_mask: 標記當前日期中新增職缺的布林數組
+            removed_mask: 標記前一日期中減少職缺的布林數組
         """
         # 記錄計算職缺變化
         logger.debug("計算新增和減少的職缺")
 
-        # 獲取唯一的複合鍵
-        curr_jobs_keys = set(curr_df["composite_key"])
-        prev_jobs_keys = set(prev_df["composite_key"])
-        logger.debug(
-            f"當前日期不重複職缺: {len(curr_jobs_keys)}, 前一日期不重複職缺: {len(prev_jobs_keys)}"
-        )
-
-        # 計算新增和減少的職缺鍵
-        new_job_keys = curr_jobs_keys - prev_jobs_keys
-        removed_job_keys = prev_jobs_keys - curr_jobs_keys
-        logger.debug(
-            f"新增職缺數: {len(new_job_keys)}, 減少職缺數: {len(removed_job_keys)}"
-        )
+        # 直接在numpy數組上比對複合鍵產生布林遮罩，不建立Python集合
+        new_mask = np.isin(curr_keys, prev_keys, invert=True)
+        removed_mask = np.isin(prev_keys, curr_keys, invert=True)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "新增職缺數: %s, 減少職缺數: %s", new_mask.sum(), removed_mask.sum()
+            )
 
-        return new_job_keys, removed_job_keys
+        return new_mask, removed_mask
 
     def display_job_change_results(
         self,
         curr_date,
         curr_idx,
         job_details,
-        new_job_keys,
-        removed_job_keys,
-        curr_df,
-        prev_df,
+        new_jobs,
+        removed_jobs,
     ):
         """
         顯示職缺變化結果
@@ -549,10 +660,8 @@ class DailyChangesAnalyzer:
             curr_date: 當前日期
             curr_idx: 當前日期的索引
             job_details: 職缺詳細變化數據DataFrame
-            new_job_keys: 新增職缺的鍵集合
-            removed_job_keys: 減少職缺的鍵集合
-            curr_df: 當前日期的職缺數據框
-            prev_df: 前一日期的職缺數據框
+            new_jobs: 新增職缺的欄位數組字典
+            removed_jobs: 減少職缺的欄位數組字典
         """
         # 記錄顯示結果
         logger.debug("顯示職缺變化結果")
@@ -562,108 +671,56 @@ class DailyChangesAnalyzer:
         st.write(f"總職缺數: {job_details.iloc[curr_idx]['total_count']}")
 
         # 顯示新增職缺
-        self.display_new_jobs(new_job_keys, curr_df)
+        self.display_new_jobs(new_jobs)
 
         # 顯示減少職缺
-        self.display_removed_jobs(removed_job_keys, prev_df)
+        self.display_removed_jobs(removed_jobs)
 
-    def display_new_jobs(self, new_job_keys, curr_df):
+    def display_new_jobs(self, new_jobs):
         """
         顯示新增職缺
 
         參數:
-            new_job_keys: 新增職缺的鍵集合
-            curr_df: 當前日期的職缺數據框
+            new_jobs: 新增職缺的欄位數組字典
         """
-        # 檢查是否有新增職缺
-        if len(new_job_keys) == 0:
-            return
-
         # 記錄顯示新增職缺
-        logger.debug(f"顯示 {len(new_job_keys)} 個新增職缺")
-        st.write(f"#### 新增職缺 ({len(new_job_keys)}):")
-
-        # 過濾只顯示新增職缺
-        new_jobs_df = curr_df[curr_df["composite_key"].isin(new_job_keys)]
-
-        # 刪除複合鍵列用於顯示
-        new_jobs_df = new_jobs_df.drop(columns=["composite_key"])
-
-        # 將DataFrame轉換為prepare_jobs_analysis_df所需的格式
-        jobs_df = pd.DataFrame(
-            {
-                "jobName": new_jobs_df["職缺名稱"],
-                "custName": new_jobs_df["公司名稱"],
-                "city": new_jobs_df["城市"],
-                "district": new_jobs_df["地區"],
-                "job": new_jobs_df["job"],
-                "search_keyword": new_jobs_df["search_keyword"],
-            }
-        )
+        logger.debug(f"顯示 {len(new_jobs['jobName'])} 個新增職缺")
+        self._render_jobs_table(new_jobs, "新增職缺")
 
-        # 使用prepare_jobs_analysis_df優化DataFrame
-        from apps.visualization.analysis.df_utils import (
-            get_job_display_columns,
-            prepare_jobs_analysis_df,
-        )
-
-        optimized_df = prepare_jobs_analysis_df(jobs_df)
-
-        # 獲取顯示列
-        display_columns = get_job_display_columns(optimized_df)
-
-        # 只顯示存在的列
-        display_df = optimized_df[display_columns]
+    def display_removed_jobs(self, removed_jobs):
+        """
+        顯示減少職缺
 
-        st.dataframe(display_df, use_container_width=True)
+        參數:
+            removed_jobs: 減少職缺的欄位數組字典
+        """
+        # 記錄顯示減少職缺
+        logger.debug(f"顯示 {len(removed_jobs['jobName'])} 個減少職缺")
+        self._render_jobs_table(removed_jobs, "減少職缺")
 
-    def display_removed_jobs(self, removed_job_keys, prev_df):
+    def _render_jobs_table(self, jobs, title):
         """
-        顯示減少職缺
+        將比較用的職缺數組轉換為標準分析格式並顯示為表格
 
         參數:
-            removed_job_keys: 減少職缺的鍵集合
-            prev_df: 前一日期的職缺數據框
+            jobs: 新增或減少職缺的欄位數組字典
+            title: 表格標題
         """
-        # 檢查是否有減少職缺
-        if len(removed_job_keys) == 0:
+        # 檢查是否有職缺
+        job_count = len(jobs["jobName"])
+        if job_count == 0:
             return
 
-        # 記錄顯示減少職缺
-        logger.debug(f"顯示 {len(removed_job_keys)} 個減少職缺")
-        st.write(f"#### 減少職缺 ({len(removed_job_keys)}):")
-
-        # 過濾只顯示減少職缺
-        removed_jobs_df = prev_df[prev_df["composite_key"].isin(removed_job_keys)]
-
-        # 刪除複合鍵列用於顯示
-        removed_jobs_df = removed_jobs_df.drop(columns=["composite_key"])
-
-        # 將DataFrame轉換為prepare_jobs_analysis_df所需的格式
-        jobs_df = pd.DataFrame(
-            {
-                "jobName": removed_jobs_df["職缺名稱"],
-                "custName": removed_jobs_df["公司名稱"],
-                "city": removed_jobs_df["城市"],
-                "district": removed_jobs_df["地區"],
-                "job": removed_jobs_df["job"],
-                "search_keyword": removed_jobs_df["search_keyword"],
-            }
-        )
-
-        # 使用prepare_jobs_analysis_df優化DataFrame
-        from apps.visualization.analysis.df_utils import (
-            get_job_display_columns,
-            prepare_jobs_analysis_df,
-        )
+        st.write(f"#### {title} ({job_count}):")
 
-        optimized_df = prepare_jobs_analysis_df(jobs_df)
+        # 僅在需要顯示時才構造DataFrame，欄位已是prepare_jobs_analysis_df所需的名稱
+        raw_df = pd.DataFrame(jobs)
 
-        # 獲取顯示列
-        display_columns = get_job_display_columns(optimized_df)
+        # 使用prepare_jobs_analysis_df優化DataFrame
+        optimized_df = prepare_jobs_analysis_df(raw_df)
 
-        # 只顯示存在的列
-        display_df = optimized_df[display_columns]
+        # 獲取顯示列，只顯示存在的列
+        display_df = optimized_df[get_job_display_columns(optimized_df)]
 
         st.dataframe(display_df, use_container_width=True)
 
@@ -718,13 +775,46 @@ class DailyChangesPageRenderer:
                 return
 
             # 分析每日職缺變化
-            self.daily_changes_analyzer.analyze_daily_changes(jobs_df)
+            self.daily_changes_analyzer.analyze_daily_changes(jobs_df, months)
 
         except Exception as e:
             logger.error(f"顯示每日職缺變化分析頁面時發生錯誤: {str(e)}", exc_info=True)
             st.error(f"分析數據時發生錯誤: {str(e)}")
 
 
+# 日歷的星期標題
+_WEEKDAY_LABELS = ["一", "二", "三", "四", "五", "六", "日"]
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _build_calendar_weeks(
+    selected_year: int,
+    selected_month: int,
+    day_counts: Tuple[Tuple[date, int], ...],
+) -> List[List[Optional[Tuple[date, int]]]]:
+    """
+    按週排列單月的日期和當天的新增職缺數，供日歷網格直接渲染。
+
+    參數:
+        selected_year: 年份
+        selected_month: 月份
+        day_counts: 當月每天的新增職缺數，格式為((日期, 新增職缺數), ...)
+
+    返回:
+        List[List[Optional[Tuple[date, int]]]]: 每週7格，格內為(日期, 新增職缺數)，
+        月初和月底不屬於當月的格為None
+    """
+    month_start = pd.Timestamp(selected_year, selected_month, 1)
+    days_in_month = pd.date_range(month_start, month_start + pd.offsets.MonthEnd(1))
+    counts = dict(day_counts)
+
+    # 月初不是星期一時前面補空格，月底補滿最後一週
+    cells = [None] * month_start.weekday()
+    cells += [(day, int(counts.get(day, 0))) for day in days_in_month.date]
+    cells += [None] * (-len(cells) % 7)
+    return [cells[i : i + 7] for i in range(0, len(cells), 7)]
+
+
 def display_monthly_calendar_view(
     daily_jobs, jobs_df, on_date_selected: Optional[Callable] = None
 ):
@@ -741,8 +831,10 @@ def display_monthly_calendar_view(
     st.subheader("每月新增職缺日歷視圖")
     logger.info("創建每月新增職缺日歷視圖")
 
-    # 確保日期列是日期類型
+    # 確保日期列是日期類型，並按日期排序（分析器輸出通常已排序）
     daily_jobs["appear_date"] = pd.to_datetime(daily_jobs["appear_date"])
+    if not daily_jobs["appear_date"].is_monotonic_increasing:
+        daily_jobs = daily_jobs.sort_values("appear_date")
 
     # 獲取數據中的最小和最大日期
     min_date = daily_jobs["appear_date"].min()
@@ -757,7 +849,11 @@ def display_monthly_calendar_view(
 
     # 創建月份選擇器 - 使用更美觀的選擇器
     st.markdown("### 選擇月份查看職缺變化")
-    month_options = [month.strftime("%Y年%m月") for month in months]
+    # 月份標籤對應(年, 月)，選擇後直接查表，不必再解析字串
+    label_to_ym = {
+        month.strftime("%Y年%m月"): (month.year, month.month) for month in months
+    }
+    month_options = list(label_to_ym)
 
     # 使用容器和列來美化月份選擇器
     month_container = st.container()
@@ -777,17 +873,16 @@ def display_monthly_calendar_view(
                 unsafe_allow_html=True,
             )
 
-    # 將選擇的月份字符串轉換回日期對象
-    selected_year = int(selected_month_str.split("年")[0])
-    selected_month = int(selected_month_str.split("年")[1].split("月")[0])
+    # 將選擇的月份標籤轉換回日期對象
+    selected_year, selected_month = label_to_ym[selected_month_str]
     selected_month_start = pd.Timestamp(selected_year, selected_month, 1)
     selected_month_end = selected_month_start + pd.offsets.MonthEnd(1)
 
-    # 篩選選定月份的數據
-    month_data = daily_jobs[
-        (daily_jobs["appear_date"] >= selected_month_start)
-        & (daily_jobs["appear_date"] <= selected_month_end)
-    ]
+    # 篩選選定月份的數據：日期已排序，以二分搜尋取得切片範圍
+    appear_dates = daily_jobs["appear_date"].to_numpy()
+    lo = np.searchsorted(appear_dates, np.datetime64(selected_month_start), "left")
+    hi = np.searchsorted(appear_dates, np.datetime64(selected_month_end), "right")
+    month_data = daily_jobs.iloc[lo:hi]
 
     if month_data.empty:
         st.info(f"{selected_month_str}沒有職缺數據")
@@ -805,12 +900,6 @@ def display_monthly_calendar_view(
         unsafe_allow_html=True,
     )
 
-    # 創建當月的日期範圍
-    days_in_month = pd.date_range(selected_month_start, selected_month_end)
-
-    # 獲取當月第一天是星期幾 (0=星期一, 6=星期日)
-    first_day_weekday = selected_month_start.weekday()
-
     # 創建日歷網格 - 使用更美觀的容器
     calendar_container = st.container()
     with calendar_container:
@@ -825,141 +914,55 @@ def display_monthly_calendar_view(
             unsafe_allow_html=True,
         )
 
-        # 使用st.columns創建7列代表一週的7天
-        cols = st.columns(7)
+        # 預先計算每天的新增職缺數，日歷網格直接查表
+        day_counts = (
+            month_data.groupby(month_data["appear_date"].dt.date)["new_jobs"]
+            .sum()
+            .to_dict()
+        )
 
-        # 顯示星期標題 - 美化星期標題
-        weekdays = ["一", "二", "三", "四", "五", "六", "日"]
-        for i, day in enumerate(weekdays):
-            # 週末使用不同顏色
-            if i >= 5:  # 週六和週日
-                color = "#ff4b4b"  # 紅色
-            else:
-                color = "#0068c9"  # 藍色
-
-            cols[i].markdown(
-                f"""
-                <div style='text-align: center; padding: 8px; background-color: #f0f2f6; 
-                border-radius: 5px; font-weight: bold; color: {color};'>
-                    {day}
-                </div>
-                """,
+        # 星期標題，週末使用紅色
+        header_cols = st.columns(7)
+        for i, day in enumerate(_WEEKDAY_LABELS):
+            color = "#ff4b4b" if i >= 5 else "#0068c9"
+            header_cols[i].markdown(
+                f"<div style='text-align: center; padding: 8px; "
+                f"font-weight: bold; color: {color};'>{day}</div>",
                 unsafe_allow_html=True,
             )
 
-        # 計算需要顯示的行數
-        num_rows = (len(days_in_month) + first_day_weekday + 6) // 7
-
-        # 創建日歷網格
-        day_idx = -first_day_weekday  # 從負數開始以處理月初不是星期一的情況
-
         # 使用session_state來存儲選中的日期
         if "selected_date" not in st.session_state:
             st.session_state.selected_date = None
 
-        # 獲取當月最大的新增職缺數，用於顏色強度計算
-        max_new_jobs = month_data["new_jobs"].max() if not month_data.empty else 0
-
-        for row in range(num_rows):
-            # 為每一行創建7列
+        # 日期排列由快取提供，有新增職缺的日期可點擊，其他日期只顯示
+        today = datetime.now().date()
+        weeks = _build_calendar_weeks(
+            selected_year, selected_month, tuple(day_counts.items())
+        )
+        for week in weeks:
             day_cols = st.columns(7)
-
-            for col in range(7):
-                day_idx += 1
-                if day_idx < 0 or day_idx >= len(days_in_month):
-                    # 當月之外的日期顯示空白
-                    day_cols[col].markdown("&nbsp;")
+            for day_col, cell in zip(day_cols, week):
+                if cell is None:
+                    day_col.markdown("&nbsp;")
+                    continue
+
+                current_date, new_jobs_count = cell
+                day_label = (
+                    f"📌 {current_date.day}"
+                    if current_date == today
+                    else str(current_date.day)
+                )
+                button_key = f"date_button_{current_date.strftime('%Y%m%d')}"
+                if new_jobs_count > 0:
+                    if day_col.button(
+                        f"{day_label}\n{new_jobs_count}(個職缺)",
+                        key=button_key,
+                        type="primary",
+                    ):
+                        st.session_state.selected_date = current_date
                 else:
-                    current_date = days_in_month[day_idx]
-                    day_str = str(current_date.day)
-
-                    # 查找當天的新增職缺數
-                    day_data = month_data[
-                        month_data["appear_date"].dt.date == current_date.date()
-                    ]
-                    new_jobs_count = (
-                        day_data["new_jobs"].sum() if not day_data.empty else 0
-                    )
-
-                    # 創建一個唯一的按鈕鍵
-                    button_key = f"date_button_{current_date.strftime('%Y%m%d')}"
-
-                    # 檢查是否為今天
-                    is_today = current_date.date() == datetime.now().date()
-
-                    # 檢查是否為週末
-                    is_weekend = current_date.weekday() >= 5
-
-                    # 根據新增職缺數量設置顏色
-                    if new_jobs_count > 0:
-                        # 計算顏色強度 - 根據最大值進行歸一化
-                        color_intensity = min(
-                            0.2 + (new_jobs_count / max(max_new_jobs, 1)) * 0.8, 1.0
-                        )
-
-                        # 使用綠色顯示有新增職缺的日期，並使其可點擊
-                        bg_color = "#f0f2f6"
-                        text_color = "#333333"  # 默認文字顏色
-                        border = ""
-
-                        day_cols[col].markdown(
-                            f"""
-                                     <style>
-                                         .stColumn div[data-testid="stColumn"] {{
-                                              text-align: center; padding: 10px; background-color: {bg_color}; color: {text_color}; border-radius: 10px; {border}
-                                          }}
-                                          div[data-testid="stButton"] > button {{
-                                                text-align: center;
-                                         }}
-
-                                      </style>
-
-                                      """,
-                            unsafe_allow_html=True,
-                        )
-
-                        # 添加今天的標記
-                        day_label = f"{day_str}"
-                        if is_today:
-                            day_label = f"📌 {day_str}"
-
-                        if day_cols[col].button(
-                            f"{day_label}\n{int(new_jobs_count)}(個職缺)",
-                            key=button_key,
-                        ):
-                            st.session_state.selected_date = current_date.date()
-                    else:
-                        # 普通顯示沒有新增職缺的日期
-                        # 根據是否為今天和週末設置不同的樣式
-                        bg_color = (
-                            "#f0f2f6"  # 默認背景色 - 使用與其他元素相同的淺藍色背景
-                        )
-                        text_color = "#333333"  # 默認文字顏色
-                        border = ""
-
-                        if is_today:
-                            border = "border: 2px solid #0068c9;"  # 今天加藍色邊框
-                            day_str = f"📌 {day_str}"  # 今天加標記
-
-                        if is_weekend:
-                            bg_color = "#f0f0f0"  # 週末使用淺灰色背景
-                            text_color = "#666666"  # 週末使用灰色文字
-
-                        day_cols[col].markdown(
-                            f"""
-                           <style>
-                               div[data-testid="stColumn"] {{
-                                    text-align: center; 
-                                    padding: 10px; 
-                                }}
-                            </style>
-                            """,
-                            unsafe_allow_html=True,
-                        )
-
-                        day_cols[col].button(
-                            f"{day_str}",
-                        )
+                    day_col.button(day_label, key=button_key, disabled=True)
 
     # 如果有選中的日期，顯示該日期的職缺詳情
     if st.session_state.selected_date:
@@ -972,83 +975,206 @@ def display_monthly_calendar_view(
     logger.info("每月新增職缺日歷視圖顯示完成")
 
 
-def create_job_trend_chart(chart_data):
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _build_trend_figure(
+    dates: np.ndarray, new: np.ndarray, removed: np.ndarray, net: np.ndarray
+) -> dict:
+    """
+    構建職缺趨勢圖表並快取其字典形式，相同數據在重新執行時不再重建圖表。
+
+    參數:
+        dates: 日期數組
+        new: 每日新增職缺數
+        removed: 每日減少職缺數
+        net: 每日淨變化
+
+    返回:
+        dict: Plotly圖表的字典形式
+    """
+    scatter_cls = go.Scattergl if len(dates) > WEBGL_MIN_POINTS else go.Scatter
+    traces = []
+    for name, values, color in (
+        ("新增職缺", new, "green"),
+        ("減少職缺", removed, "red"),
+        ("淨變化", net, "blue"),
+    ):
+        # 只在圖表邊界降採樣，表格仍使用完整數據
+        if len(values) > MAX_TREND_POINTS:
+            keep = lttb_downsample_indices(dates, values, MAX_TREND_POINTS)
+            x, y = dates[keep], values[keep]
+        else:
+            x, y = dates, values
+        # 固定的懸停模板，省去Plotly.js逐點組合預設懸停內容
+        traces.append(
+            scatter_cls(
+                x=x,
+                y=y,
+                name=name,
+                mode="lines",
+                line=dict(color=color, width=2),
+                fill=None,
+                connectgaps=False,
+                hovertemplate=f"{name}: %{{y}}<extra></extra>",
+            )
+        )
+
+    # 一次傳入所有曲線和版面設定，避免逐次add_trace和update_layout重複驗證
+    fig = go.Figure(
+        data=traces,
+        layout={
+            "title": {"text": "每日職缺變化趨勢"},
+            "xaxis": {"title": {"text": "日期"}},
+            "yaxis": {"title": {"text": "職缺數量"}},
+            "hovermode": "x unified",
+            "hoverlabel": {"namelength": -1},
+        },
+    )
+    # 快取字典而非圖表對象，命中快取時反序列化的成本較低
+    return fig.to_dict()
+
+
+def create_job_trend_chart(dates, new, removed, net):
     """
     創建職缺趨勢圖表
 
     參數:
-        chart_data: 圖表數據DataFrame
+        dates: 日期數組
+        new: 每日新增職缺數組
+        removed: 每日減少職缺數組
+        net: 每日淨變化數組
 
     返回:
-        fig: Plotly圖表對象
+        dict: 可直接交給st.plotly_chart的圖表字典
     """
     # 記錄創建圖表
     logger.debug("創建職缺趨勢圖表")
-    fig = go.Figure()
-    fig.add_trace(
-        go.Scatter(
-            x=chart_data["date"],
-            y=chart_data["新增職缺"],
-            name="新增職缺",
-            line=dict(color="green", width=2),
-        )
+    fig = _build_trend_figure(dates, new, removed, net)
+    logger.debug("圖表配置完成，準備顯示")
+
+    return fig
+
+
+def select_daily_aggregation(
+    months: Optional[int] = None,
+) -> Tuple[Optional[str], str]:
+    """
+    顯示趨勢圖表的聚合粒度和聚合方式選擇器。
+
+    參數:
+        months: 查詢的月份數量，不限或超過AGGREGATE_MONTHS_THRESHOLD時默認按週聚合
+
+    返回:
+        (freq, how): pandas resample頻率（None表示不聚合）和聚合函數名稱
+    """
+    default_period = (
+        "週" if months is None or months > AGGREGATE_MONTHS_THRESHOLD else "原始"
     )
-    fig.add_trace(
-        go.Scatter(
-            x=chart_data["date"],
-            y=chart_data["減少職缺"],
-            name="減少職缺",
-            line=dict(color="red", width=2),
+    period_labels = list(AGGREGATION_PERIODS)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        period = st.selectbox(
+            "時間粒度",
+            period_labels,
+            index=period_labels.index(default_period),
+            key="daily_trend_period",
         )
-    )
-    fig.add_trace(
-        go.Scatter(
-            x=chart_data["date"],
-            y=chart_data["淨變化"],
-            name="淨變化",
-            line=dict(color="blue", width=2),
+    with col2:
+        func = st.selectbox(
+            "聚合方式",
+            list(AGGREGATION_FUNCS),
+            key="daily_trend_func",
+            disabled=AGGREGATION_PERIODS[period] is None,
         )
-    )
 
-    fig.update_layout(
-        title="每日職缺變化趨勢",
-        xaxis_title="日期",
-        yaxis_title="職缺數量",
-        hovermode="x unified",
+    return AGGREGATION_PERIODS[period], AGGREGATION_FUNCS[func]
+
+
+def aggregate_daily_jobs(
+    daily_jobs: pd.DataFrame, freq: Optional[str], how: str = "sum"
+) -> pd.DataFrame:
+    """
+    將每日職缺變化數據按時間粒度聚合，減少趨勢圖和表格需要處理的點數。
+
+    參數:
+        daily_jobs: 每日職缺變化數據DataFrame
+        freq: pandas resample頻率，例如'W'或'MS'；為None時原樣返回
+        how: 新增和減少職缺數的聚合函數，例如'sum'、'mean'或'max'
+
+    返回:
+        pd.DataFrame: 聚合後的數據，欄位與daily_jobs相同
+    """
+    if freq is None:
+        return daily_jobs
+
+    # 以單一鏈式運算構建結果，避免逐欄寫入造成DataFrame碎片化
+    # 沒有數據的區間：新增、減少和淨變化視為0，職缺總數沿用上一個區間；
+    # 變化率在聚合後重新計算
+    return (
+        daily_jobs.set_index("appear_date")
+        .resample(freq)
+        .agg({"new_jobs": how, "removed_jobs": how, "net_jobs": how, "jobNo": "last"})
+        .fillna({"new_jobs": 0, "removed_jobs": 0, "net_jobs": 0})
+        .assign(
+            jobNo=lambda d: d["jobNo"].ffill(),
+            new_delta=lambda d: d["new_jobs"].diff(),
+            removed_delta=lambda d: d["removed_jobs"].diff(),
+        )
+        .reset_index()
     )
-    logger.debug("圖表配置完成，準備顯示")
 
-    return fig
 
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def prepare_daily_display(
+    daily_jobs: pd.DataFrame, freq: Optional[str], how: str = "sum"
+) -> Tuple[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray], pd.DataFrame]:
+    """
+    一次準備趨勢圖表和詳情表格所需的數據，兩者共用同一份聚合結果。
+
+    參數:
+        daily_jobs: 每日職缺變化數據DataFrame
+        freq: pandas resample頻率；為None時不聚合
+        how: 新增和減少職缺數的聚合函數
+
+    返回:
+        ((dates, new, removed, net), display_df): 趨勢圖表的數組和詳情表格的DataFrame
+    """
+    display_df = aggregate_daily_jobs(daily_jobs, freq, how)
+
+    # 圖表數組使用32位元類型，Plotly序列化的數據量減半；
+    # 計數為整數時用int32，按平均聚合得到的小數則用float32
+    new = display_df["new_jobs"].to_numpy()
+    dtype = np.int32 if np.issubdtype(new.dtype, np.integer) else np.float32
+    new = new.astype(dtype, copy=False)
+    removed = display_df["removed_jobs"].to_numpy().astype(dtype, copy=False)
+    # 淨變化由TrendAnalyzer預先計算並隨數據聚合（最大值不能由新增和減少相減得到）
+    net = display_df["net_jobs"].to_numpy().astype(dtype, copy=False)
+    chart_arrays = (display_df["appear_date"].to_numpy(), new, removed, net)
+
+    return chart_arrays, display_df
 
-def display_daily_job_trend_chart(daily_jobs):
+
+def display_daily_job_trend_chart(chart_arrays):
     """
     顯示每日職缺變化趨勢圖表
 
     參數:
-        daily_jobs: 每日職缺變化數據DataFrame
+        chart_arrays: prepare_daily_display返回的(dates, new, removed, net)數組
     """
+    dates, new, removed, net = chart_arrays
+
     # 記錄顯示趨勢圖表
     logger.debug("顯示每日職缺變化趨勢圖表區塊")
     st.subheader("每日職缺變化趨勢")
     logger.info("創建每日職缺變化趨勢圖表")
-    logger.debug(
-        f"圖表數據範圍: 新增職缺 {daily_jobs['new_jobs'].min()} 至 {daily_jobs['new_jobs'].max()}, 減少職缺 {daily_jobs['removed_jobs'].min()} 至 {daily_jobs['removed_jobs'].max()}"
-    )
-
-    # 計算淨變化
-    daily_jobs["淨變化"] = daily_jobs["new_jobs"] - daily_jobs["removed_jobs"]
-    chart_data = daily_jobs.rename(
-        columns={
-            "appear_date": "date",
-            "new_jobs": "新增職缺",
-            "removed_jobs": "減少職缺",
-        }
-    )
-    logger.debug(f"圖表數據準備完成，包含 {len(chart_data)} 個數據點")
+    # 統計值僅用於調試日誌，未啟用DEBUG時跳過整列掃描
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"圖表數據範圍: 新增職缺 {new.min()} 至 {new.max()}, 減少職缺 {removed.min()} 至 {removed.max()}"
+        )
 
-    # 創建趨勢圖表
-    fig = create_job_trend_chart(chart_data)
+    # 創建趨勢圖表（以完整數組為快取鍵，數據未變化時直接重用快取的圖表）
+    fig = create_job_trend_chart(dates, new, removed, net)
     st.plotly_chart(fig, use_container_width=True)
     logger.info("每日職缺變化趨勢圖表顯示完成")
 
@@ -1065,26 +1191,23 @@ def display_daily_job_details_table(daily_jobs):
     st.subheader("每日職缺變化詳情")
     logger.info("顯示每日職缺變化詳情表格")
 
-    # 格式化數據用於顯示
-    display_df = daily_jobs.copy()
-    display_df["appear_date"] = display_df["appear_date"].dt.strftime("%Y-%m-%d")
-    display_df = display_df.rename(
-        columns={
-            "appear_date": "日期",
-            "jobNo": "職缺數",
-            "new_jobs": "新增職缺",
-            "removed_jobs": "減少職缺",
-            "new_delta": "新增變化",
-            "removed_delta": "減少變化",
-        }
+    # 直接顯示原始欄位，由column_config負責中文標題和日期格式，
+    # 不再複製、重命名或逐行格式化日期
+    column_config = {
+        col: st.column_config.NumberColumn(label)
+        for col, label in DAILY_DETAILS_COLUMNS.items()
+    }
+    column_config["appear_date"] = st.column_config.DateColumn(
+        DAILY_DETAILS_COLUMNS["appear_date"], format="YYYY-MM-DD"
     )
-    logger.debug(
-        f"表格數據準備完成，包含 {len(display_df)} 行，{len(display_df.columns)} 列"
+    # 先投影出要顯示的列，column_order只在前端隱藏其他列，不會減少序列化的數據量
+    st.dataframe(
+        daily_jobs.loc[:, list(DAILY_DETAILS_COLUMNS)],
+        column_config=column_config,
+        column_order=list(DAILY_DETAILS_COLUMNS),
+        use_container_width=True,
+        hide_index=True,
     )
-
-    # 選擇要顯示的列
-    display_cols = ["日期", "職缺數", "新增職缺", "減少職缺", "新增變化", "減少變化"]
-    st.dataframe(display_df[display_cols], use_container_width=True)
     logger.info("每日職缺變化詳情表格顯示完成")
 
 
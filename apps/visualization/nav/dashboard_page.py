@@ -4,13 +4,19 @@
 """
 
 from datetime import datetime, timedelta
+from typing import Tuple
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
-from apps.visualization.analysis.job_data_analyzer import JobDataAnalyzer
+from apps.visualization.analysis.df_utils import (
+    jobs_fingerprint,
+    lttb_downsample_indices,
+)
+from apps.visualization.analysis.job_data_analyzer import CACHE_TTL, JobDataAnalyzer
 from apps.visualization.analysis.trend_analyzer import TrendAnalyzer
 from apps.visualization.components import display_filter_info
 from config.settings import logger
@@ -46,6 +52,137 @@ ERROR_CHART_CREATION = "無法顯示職缺趨勢 - 數據格式不正確"
 ERROR_CHART_EXCEPTION = "無法顯示職缺趨勢 - 發生錯誤"
 # 表格顯示常數
 TABLE_CHECKBOX_LABEL = "顯示詳細數據表格"
+# 下架趨勢移動平均的天數
+MOVING_AVERAGE_DAYS = 7
+# 下架趨勢圖最多繪製的點數，超過時以LTTB抽樣
+DELISTED_TREND_MAX_POINTS = 3000
+# 下架趨勢圖超過此點數時改用WebGL繪製並隱藏標記
+DELISTED_WEBGL_MIN_POINTS = 2000
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_load_job_data(
+    _processor: "DashboardDataProcessor",
+    keywords: Tuple[str, ...],
+    city: str,
+    district: str,
+    limit,
+    months: int,
+):
+    """
+    以過濾條件為鍵快取職缺數據和每日統計數據，避免每次重新運行都重新計算趨勢統計。
+
+    參數:
+        _processor: DashboardDataProcessor實例，使用前導下劃線告訴Streamlit不要嘗試對此參數進行哈希處理
+        keywords: 關鍵詞元組
+        city: 城市名稱
+        district: 地區名稱
+        limit: 最大獲取職缺數量
+        months: 月份數量
+
+    返回:
+        Tuple[pd.DataFrame, pd.DataFrame]: (職缺數據DataFrame, 每日統計數據DataFrame)
+    """
+    return _processor._query_job_data(list(keywords), city, district, limit, months)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_get_delisted_jobs_data(
+    _processor: "DashboardDataProcessor", start_date, end_date
+) -> pd.DataFrame:
+    """
+    以日期範圍為鍵快取下架職缺的每日統計。
+
+    參數:
+        _processor: DashboardDataProcessor實例，使用前導下劃線告訴Streamlit不要嘗試對此參數進行哈希處理
+        start_date: 開始日期
+        end_date: 結束日期
+
+    返回:
+        pd.DataFrame: 下架職缺數據DataFrame
+    """
+    return _processor._query_delisted_jobs_data(start_date, end_date)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_prepare_delisted_jobs(
+    _renderer: "JobAnalysisRenderer", fingerprint: tuple, _jobs_analysis: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    以數據指紋為鍵快取已下架職缺的篩選和日期計算。
+
+    參數:
+        _renderer: JobAnalysisRenderer實例，使用前導下劃線告訴Streamlit不要嘗試對此參數進行哈希處理
+        fingerprint: 職缺分析數據的指紋
+        _jobs_analysis: 職缺分析數據DataFrame，不參與哈希
+
+    返回:
+        pd.DataFrame: 已下架職缺數據DataFrame
+    """
+    return _renderer._prepare_delisted_jobs(_jobs_analysis)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_delisted_rollups(
+    _renderer: "JobAnalysisRenderer", fingerprint: tuple, _delisted_jobs: pd.DataFrame
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    以數據指紋為鍵快取下架職缺的每日和每月統計。
+
+    參數:
+        _renderer: JobAnalysisRenderer實例，使用前導下劃線告訴Streamlit不要嘗試對此參數進行哈希處理
+        fingerprint: 下架職缺數據的指紋
+        _delisted_jobs: 下架職缺數據DataFrame，不參與哈希
+
+    返回:
+        Tuple[pd.DataFrame, pd.DataFrame]: (每日下架數量, 每月下架數量)
+    """
+    return _renderer._build_delisted_rollups(_delisted_jobs)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_delisted_csv(
+    fingerprint: tuple,
+    sort_col: str,
+    ascending: bool,
+    columns: Tuple[str, ...],
+    _delisted_jobs: pd.DataFrame,
+) -> bytes:
+    """
+    以數據指紋、排序方式和欄位為鍵快取下架職缺的CSV內容。
+
+    參數:
+        fingerprint: 下架職缺數據的指紋
+        sort_col: 排序欄位
+        ascending: 是否升序排列
+        columns: 要輸出的欄位
+        _delisted_jobs: 下架職缺數據DataFrame，不參與哈希
+
+    返回:
+        bytes: UTF-8編碼的CSV內容
+    """
+    sorted_jobs = _delisted_jobs.sort_values(sort_col, ascending=ascending)
+    return sorted_jobs[list(columns)].to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_job_trend_chart(
+    _renderer: "DashboardPageRenderer",
+    chart_data: pd.DataFrame,
+    show_options: Tuple[str, ...],
+) -> go.Figure:
+    """
+    以圖表數據和顯示選項為鍵快取職缺趨勢圖表。
+
+    參數:
+        _renderer: DashboardPageRenderer實例，使用前導下劃線告訴Streamlit不要嘗試對此參數進行哈希處理
+        chart_data: 圖表數據DataFrame
+        show_options: 要顯示的數據選項元組
+
+    返回:
+        go.Figure: Plotly圖表對象
+    """
+    return _renderer._build_job_trend_chart(chart_data, list(show_options))
 
 
 class DashboardDataProcessor:
@@ -56,15 +193,19 @@ class DashboardDataProcessor:
     遵循單一職責原則，專注於數據處理邏輯，不包含UI渲染邏輯。
     """
 
-    def __init__(self, job_data_analyzer: JobDataAnalyzer):
+    def __init__(
+        self, job_data_analyzer: JobDataAnalyzer, trend_analyzer: TrendAnalyzer
+    ):
         """
         初始化儀表板數據處理器。
 
         參數:
             job_data_analyzer: JobDataAnalyzer實例，用於數據處理
+            trend_analyzer: TrendAnalyzer實例，由應用程式層快取共用
         """
         self.job_data_analyzer = job_data_analyzer
         self.db_manager = job_data_analyzer.db_manager
+        self.trend_analyzer = trend_analyzer
 
     def load_job_data(
         self, keywords=None, city=None, district=None, limit=DEFAULT_LIMIT, months=None
@@ -83,34 +224,39 @@ class DashboardDataProcessor:
             Tuple[pd.DataFrame, pd.DataFrame]: (職缺數據DataFrame, 每日統計數據DataFrame)
             如果沒有數據，返回(None, None)
         """
+        return _cached_load_job_data(
+            self, tuple(keywords) if keywords else (), city, district, limit, months
+        )
+
+    def _query_job_data(self, keywords, city, district, limit, months):
+        """
+        實際查詢職缺數據並計算每日統計數據，由快取函數調用。
+
+        參數:
+            keywords: 關鍵詞列表
+            city: 城市名稱
+            district: 地區名稱
+            limit: 最大獲取職缺數量
+            months: 月份數量
+
+        返回:
+            Tuple[pd.DataFrame, pd.DataFrame]: (職缺數據DataFrame, 每日統計數據DataFrame)
+        """
         # 獲取所有帶過濾條件的職缺
         logger.info("從數據庫獲取職缺數據")
         jobs_df = self.job_data_analyzer.get_jobs(
             limit=limit, months=months, keywords=keywords, city=city, district=district
         )
-        logger.debug(f"獲取到 {len(jobs_df)} 條職缺數據")
+        jobs_count = len(jobs_df)
+        logger.info(f"獲取到 {jobs_count} 筆職缺數據")
 
-        if jobs_df.empty:
+        if jobs_count == 0:
             logger.warning("數據庫中沒有符合條件的職缺數據")
             return None, None
 
-        # 從數據庫獲取每日統計數據
-        logger.info("獲取每日統計數據")
-
-        trend_analyzer = TrendAnalyzer()
-
-        # 1. 從數據庫獲取職缺數據
-        logger.info("從數據庫獲取職缺數據")
-
-        if jobs_df.empty:
-            logger.warning("數據庫中沒有職缺數據，無法計算每日統計")
-            return
-
-        logger.info(f"獲取到 {len(jobs_df)} 筆職缺數據")
-
-        # 2. 計算每日職缺變化
+        # 計算每日職缺變化
         logger.info("計算每日職缺變化")
-        stats_df = trend_analyzer.create_job_trend_chart(jobs_df)
+        stats_df = self.trend_analyzer.create_job_trend_chart(jobs_df)
 
         return jobs_df, stats_df
 
@@ -151,45 +297,51 @@ class DashboardDataProcessor:
         返回:
             pd.DataFrame: 下架職缺數據DataFrame
         """
-        try:
-            # 獲取包括已下架職缺的數據
-            all_jobs_df = self.job_data_analyzer.get_jobs(
-                limit=DEFAULT_LIMIT, include_inactive=True
-            )
-
-            # 過濾出已下架的職缺
-            if (
-                "status" in all_jobs_df.columns
-                and "delisted_date" in all_jobs_df.columns
-            ):
-                delisted_jobs = all_jobs_df[
-                    (all_jobs_df["status"] == "inactive")
-                    & (all_jobs_df["delisted_date"].notna())
-                ]
-
-                # 將下架日期轉換為日期格式
-                delisted_jobs["delisted_date"] = pd.to_datetime(
-                    delisted_jobs["delisted_date"]
-                )
+        return _cached_get_delisted_jobs_data(self, start_date, end_date)
 
-                # 按下架日期分組統計
-                delisted_by_date = (
-                    delisted_jobs.groupby("delisted_date").size().reset_index()
-                )
-                delisted_by_date.columns = ["date", "delisted_count"]
+    def _query_delisted_jobs_data(self, start_date, end_date):
+        """
+        實際查詢並統計下架職缺數據，由快取函數調用。
 
-                # 過濾指定日期範圍
-                delisted_by_date = delisted_by_date[
-                    (delisted_by_date["date"] >= start_date)
-                    & (delisted_by_date["date"] <= end_date)
-                ]
+        參數:
+            start_date: 開始日期
+            end_date: 結束日期
 
-                return delisted_by_date
+        返回:
+            pd.DataFrame: 下架職缺數據DataFrame
+        """
+        try:
+            # 在數據庫中完成篩選和按日期分組，只取回每天一行的統計結果
+            return self.db_manager.get_delisted_counts_by_date(start_date, end_date)
         except Exception as e:
             logger.warning(f"獲取下架職缺數據時發生錯誤: {str(e)}")
             raise ValueError(f"獲取下架職缺數據失敗: {str(e)}")
 
-        return pd.DataFrame()
+    def merge_delisted_counts(self, stats, delisted_data):
+        """
+        將每日下架職缺數量按日期併入每日統計數據。
+
+        兩者都按日期排序，以二分搜尋對齊日期，不需要建立哈希表進行合併。
+
+        參數:
+            stats: 每日統計數據DataFrame
+            delisted_data: 下架職缺數據DataFrame，包含date和delisted_count列
+
+        返回:
+            pd.DataFrame: 添加了delisted_count列的每日統計數據，沒有下架職缺的日期為0
+        """
+        delisted_dates = delisted_data["date"].to_numpy()
+        stats_dates = stats["date"].to_numpy()
+
+        # 找到每個統計日期在下架數據中的位置，只有日期完全相同時才取其數量
+        idx = np.searchsorted(delisted_dates, stats_dates)
+        idx = np.clip(idx, 0, len(delisted_dates) - 1)
+        matched = delisted_dates[idx] == stats_dates
+
+        delisted_count = np.where(
+            matched, delisted_data["delisted_count"].to_numpy()[idx], 0
+        )
+        return stats.assign(delisted_count=delisted_count)
 
     def prepare_jobs_analysis(self, jobs_df):
         """
@@ -217,7 +369,8 @@ class DashboardDataProcessor:
         if date_range == "全部時間":
             return data
 
-        end_date = data["date"].max()
+        # 每日統計數據已由TrendAnalyzer按日期排序，最後一行即為最新日期
+        end_date = data["date"].iloc[-1]
         if date_range == "最近7天":
             start_date = end_date - timedelta(days=7)
         elif date_range == "最近30天":
@@ -227,7 +380,9 @@ class DashboardDataProcessor:
         else:
             return data
 
-        return data[data["date"] >= start_date]
+        # 日期已排序，以二分搜尋找到起始位置後直接切片，不需要逐行比較
+        start_idx = data["date"].to_numpy().searchsorted(np.datetime64(start_date))
+        return data.iloc[start_idx:]
 
     def prepare_chart_data(self, filtered_stats, include_delisted=False):
         """
@@ -240,19 +395,19 @@ class DashboardDataProcessor:
         返回:
             pd.DataFrame: 準備好的圖表數據
         """
-        # 計算淨變化和累計變化
-        filtered_stats = filtered_stats.copy()
-        filtered_stats["淨變化"] = (
-            filtered_stats["new_jobs"] - filtered_stats["removed_jobs"]
+        # 計算淨變化和累計變化：直接在numpy數組上運算，省去Series的索引對齊
+        net_change = (
+            filtered_stats["new_jobs"].to_numpy()
+            - filtered_stats["removed_jobs"].to_numpy()
         )
-        filtered_stats["累計變化"] = filtered_stats["淨變化"].cumsum()
+        new_columns = {"淨變化": net_change, "累計變化": net_change.cumsum()}
 
         # 如果需要包含下架職缺數據
         if include_delisted and "delisted_count" in filtered_stats.columns:
-            filtered_stats["下架職缺"] = filtered_stats["delisted_count"].fillna(0)
+            new_columns["下架職缺"] = lambda df: df["delisted_count"].fillna(0)
 
-        # 重命名列以便於圖表顯示
-        return filtered_stats.rename(columns=COLUMN_MAPPING)
+        # 新增列和重命名在同一條鏈中完成，assign返回新的DataFrame，不需要預先複製
+        return filtered_stats.assign(**new_columns).rename(columns=COLUMN_MAPPING)
 
     def has_required_columns(self, df, required_columns):
         """
@@ -265,7 +420,7 @@ class DashboardDataProcessor:
         返回:
             bool: 如果包含所有所需列，則為True，否則為False
         """
-        return all(col in df.columns for col in required_columns)
+        return set(required_columns).issubset(df.columns)
 
 
 class DashboardPageRenderer:
@@ -360,12 +515,12 @@ class DashboardPageRenderer:
         參數:
             chart_data: 圖表數據DataFrame
         """
-        # 準備顯示數據
-        display_df = chart_data.copy()
-
-        # 格式化日期
-        if isinstance(display_df["日期"].iloc[0], pd.Timestamp):
-            display_df["日期"] = display_df["日期"].dt.strftime("%Y-%m-%d")
+        # 格式化日期，只新建日期一列，其餘列沿用原數據
+        display_df = chart_data
+        if pd.api.types.is_datetime64_any_dtype(chart_data["日期"]):
+            display_df = chart_data.assign(
+                日期=chart_data["日期"].dt.strftime("%Y-%m-%d")
+            )
 
         # 顯示表格
         st.dataframe(display_df, use_container_width=True)
@@ -374,6 +529,21 @@ class DashboardPageRenderer:
         """
         創建職缺趨勢圖表。
 
+        圖表以數據和顯示選項為鍵快取，切換其他控件時不會重建圖表對象。
+
+        參數:
+            chart_data: 圖表數據DataFrame
+            show_options: 要顯示的數據選項列表
+
+        返回:
+            go.Figure: Plotly圖表對象
+        """
+        return _cached_job_trend_chart(self, chart_data, tuple(show_options))
+
+    def _build_job_trend_chart(self, chart_data, show_options):
+        """
+        構建職缺趨勢圖表，由快取函數調用。
+
         參數:
             chart_data: 圖表數據DataFrame
             show_options: 要顯示的數據選項列表
@@ -430,24 +600,24 @@ class DashboardPageRenderer:
                 return fig
 
         try:
-            fig = go.Figure()
-
-            # 添加各種數據線
-            for option in show_options:
-                if option in chart_data.columns:
-                    fig.add_trace(
-                        go.Scatter(
-                            x=chart_data["日期"],
-                            y=chart_data[option],
-                            name=option,
-                            line=dict(
-                                color=COLOR_MAP.get(option, "gray"),
-                                width=2,
-                                dash=DASH_MAP.get(option, None),
-                            ),
-                            mode="lines+markers" if len(chart_data) < 30 else "lines",
-                        )
-                    )
+            # 轉為長格式，由 px.line 一次生成所有數據線
+            long_df = chart_data.melt(
+                id_vars="日期",
+                value_vars=list(show_options),
+                var_name="series",
+                value_name="value",
+            )
+            fig = px.line(
+                long_df,
+                x="日期",
+                y="value",
+                color="series",
+                line_dash="series",
+                color_discrete_map=COLOR_MAP,
+                line_dash_map={k: v or "solid" for k, v in DASH_MAP.items()},
+                markers=len(chart_data) < 30,
+            )
+            fig.update_traces(line_width=2)
 
             # 添加零線（對於淨變化）
             if "淨變化" in show_options:
@@ -565,8 +735,8 @@ class DashboardPageRenderer:
 
                     if include_delisted:
                         # 合併下架數據
-                        filtered_stats = pd.merge(
-                            filtered_stats, delisted_data, on="date", how="left"
+                        filtered_stats = data_processor.merge_delisted_counts(
+                            filtered_stats, delisted_data
                         )
                         # 添加到顯示選項
                         if "下架職缺" not in show_options and len(show_options) > 0:
@@ -605,15 +775,16 @@ class DashboardPage:
     遵循開放封閉原則，可以通過擴展而不是修改來添加新功能。
     """
 
-    def __init__(self, job_data_analyzer):
+    def __init__(self, job_data_analyzer, trend_analyzer):
         """
         初始化儀表板頁面。
 
         參數:
             job_data_analyzer: JobDataAnalyzer實例，用於數據處理
+            trend_analyzer: TrendAnalyzer實例，用於計算每日統計
         """
         self.job_data_analyzer = job_data_analyzer
-        self.data_processor = DashboardDataProcessor(job_data_analyzer)
+        self.data_processor = DashboardDataProcessor(job_data_analyzer, trend_analyzer)
         self.page_renderer = DashboardPageRenderer()
         self.job_analysis_processor = JobAnalysisProcessor(job_data_analyzer)
         self.job_analysis_renderer = JobAnalysisRenderer()
@@ -692,17 +863,15 @@ class DashboardPage:
             and not daily_stats["date"].empty
         ):
             try:
-                latest_date = daily_stats["date"].max()
-                latest_stats = daily_stats[daily_stats["date"] == latest_date]
-
-                if not latest_stats.empty:
-                    logger.debug(f"顯示最新日期 {latest_date} 的統計數據")
-                    with col2:
-                        st.metric("當日新增", f"{latest_stats['new_jobs'].iloc[0]:,}")
-                    with col3:
-                        st.metric(
-                            "當日減少", f"{latest_stats['removed_jobs'].iloc[0]:,}"
-                        )
+                # 每日統計數據按日期排序且每天一行，最後一行即為最新日期，不需要掃描整列
+                latest_stats = daily_stats.iloc[-1]
+                latest_date = latest_stats["date"]
+
+                logger.debug(f"顯示最新日期 {latest_date} 的統計數據")
+                with col2:
+                    st.metric("當日新增", f"{latest_stats['new_jobs']:,}")
+                with col3:
+                    st.metric("當日減少", f"{latest_stats['removed_jobs']:,}")
             except Exception as e:
                 logger.warning(f"無法獲取最新日期的統計數據: {str(e)}")
 
@@ -834,6 +1003,31 @@ class JobAnalysisRenderer:
     遵循單一職責原則，專注於UI渲染邏輯，不包含數據處理邏輯。
     """
 
+    @staticmethod
+    def _sorted_flagged_jobs(jobs_analysis, flag_column):
+        """
+        取得標記為True的職缺，並按在架天數降序排列。
+
+        結果以數據指紋存於session_state，拖動滑桿或勾選顯示全部時只需切片，不會重新篩選和排序。
+
+        參數:
+            jobs_analysis: 職缺分析數據DataFrame
+            flag_column: 布林標記列名，例如"是否長期未招滿"
+
+        返回:
+            pd.DataFrame: 已排序的標記職缺
+        """
+        state_key = f"_sorted_jobs_{flag_column}"
+        sig = jobs_fingerprint(jobs_analysis)
+        cached = st.session_state.get(state_key)
+        if cached is None or cached[0] != sig:
+            flagged = jobs_analysis[jobs_analysis[flag_column] == True]
+            if "在架天數" in flagged.columns:
+                flagged = flagged.sort_values("在架天數", ascending=False)
+            cached = (sig, flagged)
+            st.session_state[state_key] = cached
+        return cached[1]
+
     def render_job_analysis_header(self):
         """
         渲染職缺分析標題。
@@ -901,7 +1095,7 @@ class JobAnalysisRenderer:
         logger.debug("檢查是否有在架天數數據")
         if "在架天數" in jobs_analysis.columns:
             logger.info("分析長期未招滿職缺")
-            long_unfilled = jobs_analysis[jobs_analysis["是否長期未招滿"] == True]
+            long_unfilled = self._sorted_flagged_jobs(jobs_analysis, "是否長期未招滿")
 
             if not long_unfilled.empty:
                 logger.debug(f"找到 {len(long_unfilled)} 個長期未招滿職缺")
@@ -948,13 +1142,9 @@ class JobAnalysisRenderer:
 
                 # 根據是否顯示全部來決定顯示方式
                 if show_all:
-                    display_data = long_unfilled.sort_values(
-                        "在架天數", ascending=False
-                    )[display_cols]
+                    display_data = long_unfilled[display_cols]
                 else:
-                    display_data = long_unfilled.sort_values(
-                        "在架天數", ascending=False
-                    ).head(display_count)[display_cols]
+                    display_data = long_unfilled.head(display_count)[display_cols]
 
                 st.dataframe(
                     display_data,
@@ -979,7 +1169,7 @@ class JobAnalysisRenderer:
         # 記錄顯示近期發布職缺
         logger.debug("顯示近期發布的職缺區塊")
         st.subheader("近期發布的職缺")
-        new_job = jobs_analysis[jobs_analysis["近期發布的職缺"] == True]
+        new_job = self._sorted_flagged_jobs(jobs_analysis, "近期發布的職缺")
         logger.debug(f"找到 {len(new_job)} 個近期發布的職缺")
         st.write(f"有 {len(new_job)} 近期發布的職缺")
 
@@ -1021,13 +1211,9 @@ class JobAnalysisRenderer:
 
         # 根據是否顯示全部來決定顯示方式
         if show_all:
-            display_data = new_job.sort_values("在架天數", ascending=False)[
-                display_cols
-            ]
+            display_data = new_job[display_cols]
         else:
-            display_data = new_job.sort_values("在架天數", ascending=False).head(
-                display_count
-            )[display_cols]
+            display_data = new_job.head(display_count)[display_cols]
 
         st.dataframe(
             display_data,
@@ -1075,18 +1261,21 @@ class JobAnalysisRenderer:
         if "下架前在架天數" in delisted_jobs.columns:
             st.write("#### 下架職缺在架時間分佈")
 
-            # 創建在架時間分類
-            duration_bins = [0, 7, 30, 90, float("inf")]
+            # 創建在架時間分類，區間左閉右開，負數和缺失值不計入
+            duration_edges = [7, 30, 90]
             duration_labels = ["少於7天", "7-30天", "30-90天", "超過90天"]
 
-            delisted_jobs["在架時間分類"] = pd.cut(
-                delisted_jobs["下架前在架天數"],
-                bins=duration_bins,
-                labels=duration_labels,
-                right=False,
+            days = delisted_jobs["下架前在架天數"].to_numpy(
+                dtype=np.float64, na_value=np.nan
+            )
+            days = days[days >= 0]
+            duration_counts = pd.Series(
+                np.bincount(
+                    np.searchsorted(duration_edges, days, side="right"),
+                    minlength=len(duration_labels),
+                ),
+                index=duration_labels,
             )
-
-            duration_counts = delisted_jobs["在架時間分類"].value_counts().sort_index()
 
             # 創建圓餅圖
             fig = px.pie(
@@ -1101,6 +1290,68 @@ class JobAnalysisRenderer:
 
             st.plotly_chart(fig, use_container_width=True)
 
+    def _prepare_delisted_jobs(self, jobs_analysis):
+        """
+        篩選已下架的職缺，並計算下架日期和下架前在架天數，由快取函數調用。
+
+        參數:
+            jobs_analysis: 職缺分析數據DataFrame
+
+        返回:
+            pd.DataFrame: 已下架職缺數據DataFrame
+        """
+        delisted_jobs = jobs_analysis[
+            (jobs_analysis["status"] == "inactive")
+            & (jobs_analysis["delisted_date"].notna())
+        ]
+        delisted_jobs = delisted_jobs.assign(
+            下架日期=pd.to_datetime(delisted_jobs["delisted_date"])
+        )
+        if "上架日期" in delisted_jobs.columns:
+            delisted_jobs["下架前在架天數"] = (
+                delisted_jobs["下架日期"] - delisted_jobs["上架日期"]
+            ).dt.days
+        return delisted_jobs
+
+    def _build_delisted_rollups(self, delisted_jobs):
+        """
+        按日和按月統計下架職缺數量，由快取函數調用。
+
+        參數:
+            delisted_jobs: 下架職缺數據DataFrame
+
+        返回:
+            Tuple[pd.DataFrame, pd.DataFrame]: (每日下架數量, 每月下架數量)
+        """
+        # 以下架日期為索引重採樣，沒有下架的日期和月份記為0
+        delisted_counts = pd.Series(1, index=delisted_jobs["下架日期"].dropna())
+
+        daily_delisted = (
+            delisted_counts.resample("D")
+            .sum()
+            .rename_axis("日期")
+            .reset_index(name="下架數量")
+        )
+
+        # 7天移動平均，前幾天不足一個窗口時按已有天數平均
+        cumulative = np.cumsum(daily_delisted["下架數量"].to_numpy(dtype=np.float64))
+        window_sums = cumulative.copy()
+        window_sums[MOVING_AVERAGE_DAYS:] -= cumulative[:-MOVING_AVERAGE_DAYS]
+        window_sizes = np.minimum(
+            np.arange(1, len(cumulative) + 1), MOVING_AVERAGE_DAYS
+        )
+        daily_delisted["7天移動平均"] = window_sums / window_sizes
+
+        monthly_counts = delisted_counts.resample("MS").sum()
+        monthly_delisted = pd.DataFrame(
+            {
+                "月份": monthly_counts.index.strftime("%Y-%m"),
+                "下架數量": monthly_counts.to_numpy(),
+            }
+        )
+
+        return daily_delisted, monthly_delisted
+
     def display_delisted_jobs_trends(self, delisted_jobs):
         """
         顯示下架職缺的趨勢圖表
@@ -1111,37 +1362,43 @@ class JobAnalysisRenderer:
         if "下架日期" in delisted_jobs.columns:
             st.write("### 下架職缺趨勢")
 
-            # 按下架日期分組計算每日下架數量
-            daily_delisted = (
-                delisted_jobs.groupby(delisted_jobs["下架日期"].dt.date)
-                .size()
-                .reset_index()
+            # 每日和每月下架數量
+            daily_delisted, monthly_delisted = _cached_delisted_rollups(
+                self, jobs_fingerprint(delisted_jobs), delisted_jobs
             )
-            daily_delisted.columns = ["日期", "下架數量"]
 
-            # 確保日期是日期時間格式
-            daily_delisted["日期"] = pd.to_datetime(daily_delisted["日期"])
+            # 天數過多時只保留LTTB選出的點，峰值和谷值不會被抹平
+            trend_df = daily_delisted
+            if len(daily_delisted) > DELISTED_TREND_MAX_POINTS:
+                keep = lttb_downsample_indices(
+                    daily_delisted["日期"].to_numpy(),
+                    daily_delisted["下架數量"].to_numpy(),
+                    DELISTED_TREND_MAX_POINTS,
+                )
+                trend_df = daily_delisted.iloc[keep]
+            use_webgl = len(trend_df) > DELISTED_WEBGL_MIN_POINTS
 
             # 創建趨勢圖
             fig = px.line(
-                daily_delisted,
+                trend_df,
                 x="日期",
                 y="下架數量",
                 title="每日下架職缺數量趨勢",
-                markers=True,
+                markers=not use_webgl,
+                render_mode="webgl" if use_webgl else "auto",
             )
 
             # 添加7天移動平均線
-            if len(daily_delisted) > 7:
-                daily_delisted["7天移動平均"] = (
-                    daily_delisted["下架數量"].rolling(window=7, min_periods=1).mean()
-                )
-                fig.add_scatter(
-                    x=daily_delisted["日期"],
-                    y=daily_delisted["7天移動平均"],
-                    mode="lines",
-                    name="7天移動平均",
-                    line=dict(color="red", dash="dash"),
+            if len(daily_delisted) > MOVING_AVERAGE_DAYS:
+                scatter_cls = go.Scattergl if use_webgl else go.Scatter
+                fig.add_trace(
+                    scatter_cls(
+                        x=trend_df["日期"],
+                        y=trend_df["7天移動平均"],
+                        mode="lines",
+                        name="7天移動平均",
+                        line=dict(color="red", dash="dash"),
+                    )
                 )
 
             fig.update_layout(
@@ -1154,15 +1411,6 @@ class JobAnalysisRenderer:
             if len(daily_delisted) > 30:
                 st.write("#### 月度下架職缺數量")
 
-                # 按月份分組
-                monthly_delisted = (
-                    delisted_jobs.groupby(delisted_jobs["下架日期"].dt.to_period("M"))
-                    .size()
-                    .reset_index()
-                )
-                monthly_delisted.columns = ["月份", "下架數量"]
-                monthly_delisted["月份"] = monthly_delisted["月份"].astype(str)
-
                 # 創建柱狀圖
                 fig = px.bar(
                     monthly_delisted,
@@ -1191,43 +1439,42 @@ class JobAnalysisRenderer:
             and "delisted_date" in jobs_analysis.columns
         ):
             logger.info("分析已下架職缺")
-            # 過濾出已下架的職缺
-            delisted_jobs = jobs_analysis[
-                (jobs_analysis["status"] == "inactive")
-                & (jobs_analysis["delisted_date"].notna())
-            ]
-
-            # 過濾出活躍的職缺（用於比較）
-            active_jobs = jobs_analysis[jobs_analysis["status"] == "active"]
+            # 過濾出已下架的職缺，並取得下架日期和下架前在架天數
+            delisted_jobs = _cached_prepare_delisted_jobs(
+                self, jobs_fingerprint(jobs_analysis), jobs_analysis
+            )
 
             if not delisted_jobs.empty:
                 logger.debug(f"找到 {len(delisted_jobs)} 個已下架職缺")
                 st.subheader("已經下架的職缺分析")
 
-                # 將下架日期轉換為日期格式
-                if "delisted_date" in delisted_jobs.columns:
-                    delisted_jobs["下架日期"] = pd.to_datetime(
-                        delisted_jobs["delisted_date"]
-                    )
-
-                    # 計算下架前在架天數
-                    if "上架日期" in delisted_jobs.columns:
-                        delisted_jobs["下架前在架天數"] = (
-                            delisted_jobs["下架日期"] - delisted_jobs["上架日期"]
-                        ).dt.days
-
-                        # 顯示下架職缺統計信息
-                        self.display_delisted_jobs_statistics(delisted_jobs)
+                if "下架前在架天數" in delisted_jobs.columns:
+                    # 顯示下架職缺統計信息
+                    self.display_delisted_jobs_statistics(delisted_jobs)
 
-                        # 顯示下架職缺趨勢圖表
-                        self.display_delisted_jobs_trends(delisted_jobs)
+                    # 顯示下架職缺趨勢圖表
+                    self.display_delisted_jobs_trends(delisted_jobs)
 
-                        # 按下架日期排序，顯示最近下架的職缺
-                        sort_col = "下架日期"
-                    else:
-                        sort_col = "delisted_date"
-                else:
-                    sort_col = "jobNo"
+                # 排序選項和顯示欄位只取決於數據的欄位，在控件之前一次算好
+                # 下架日期一定存在；沒有上架日期時，按在架時間排序退回按下架日期排序
+                delisted_cols = frozenset(delisted_jobs.columns)
+                duration_col = (
+                    "下架前在架天數"
+                    if "下架前在架天數" in delisted_cols
+                    else "下架日期"
+                )
+                sort_options = {
+                    "最近下架優先": ("下架日期", False),
+                    "最早下架優先": ("下架日期", True),
+                    "在架時間最長優先": (duration_col, False),
+                    "在架時間最短優先": (duration_col, True),
+                }
+                valid_cols = [col for col in display_cols if col in delisted_cols]
+                valid_cols += [
+                    col
+                    for col in ("下架日期", "下架前在架天數")
+                    if col in delisted_cols and col not in valid_cols
+                ]
 
                 # 添加篩選選項
                 st.subheader("下架職缺詳細資料")
@@ -1236,29 +1483,6 @@ class JobAnalysisRenderer:
                 col1, col2 = st.columns(2)
                 with col1:
                     # 選擇排序方式
-                    sort_options = {
-                        "最近下架優先": (
-                            ("下架日期", False)
-                            if "下架日期" in delisted_jobs.columns
-                            else (sort_col, False)
-                        ),
-                        "最早下架優先": (
-                            ("下架日期", True)
-                            if "下架日期" in delisted_jobs.columns
-                            else (sort_col, True)
-                        ),
-                        "在架時間最長優先": (
-                            ("下架前在架天數", False)
-                            if "下架前在架天數" in delisted_jobs.columns
-                            else (sort_col, False)
-                        ),
-                        "在架時間最短優先": (
-                            ("下架前在架天數", True)
-                            if "下架前在架天數" in delisted_jobs.columns
-                            else (sort_col, True)
-                        ),
-                    }
-
                     sort_by = st.selectbox(
                         "排序方式", options=list(sort_options.keys()), index=0
                     )
@@ -1274,29 +1498,14 @@ class JobAnalysisRenderer:
                 # 顯示已下架職缺的詳細資料
                 st.write(f"### 已下架職缺列表 (共 {len(delisted_jobs)} 個)")
 
-                # 確保display_cols中的所有列都在delisted_jobs中
-                valid_cols = [
-                    col for col in display_cols if col in delisted_jobs.columns
-                ]
-
-                # 如果有下架日期列，添加到顯示列中
-                if "下架日期" in delisted_jobs.columns and "下架日期" not in valid_cols:
-                    valid_cols.append("下架日期")
-
-                # 如果有下架前在架天數列，添加到顯示列中
-                if (
-                    "下架前在架天數" in delisted_jobs.columns
-                    and "下架前在架天數" not in valid_cols
-                ):
-                    valid_cols.append("下架前在架天數")
-
-                # 排序並顯示數據
-                sorted_jobs = delisted_jobs.sort_values(
-                    sort_col, ascending=sort_ascending
-                )
+                # 只取前display_count筆，不對整個數據排序；完整排序只在CSV中進行
+                if sort_ascending:
+                    top_jobs = delisted_jobs.nsmallest(display_count, sort_col)
+                else:
+                    top_jobs = delisted_jobs.nlargest(display_count, sort_col)
 
                 st.dataframe(
-                    sorted_jobs.head(display_count)[valid_cols],
+                    top_jobs[valid_cols],
                     column_config={
                         "連結": st.column_config.LinkColumn(
                             "連結", display_text="開啟連結", width="small"
@@ -1313,168 +1522,20 @@ class JobAnalysisRenderer:
                     use_container_width=True,
                 )
 
-                # 提供下載功能
-                if st.button("下載完整下架職缺資料"):
-                    csv = sorted_jobs[valid_cols].to_csv(index=False)
-                    st.download_button(
-                        label="確認下載CSV檔案",
-                        data=csv,
-                        file_name=f"delisted_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv",
-                    )
-            else:
-                logger.debug("沒有找到已下架職缺")
-                st.info("沒有找到已下架的職缺資料")
-        else:
-            logger.debug("職缺數據中缺少下架日期或狀態信息")
-            st.info("職缺數據中缺少下架日期或狀態信息，無法分析已下架職缺")
-
-    def display_delisted_jobs(self, jobs_analysis, display_cols):
-        """
-        顯示已經下架的職缺，包含統計數據、圖表和詳細列表
-
-        參數:
-            jobs_analysis: 職缺分析數據DataFrame
-            display_cols: 要顯示的列名列表
-        """
-        # 記錄顯示已下架職缺
-        logger.debug("檢查是否有下架日期數據")
-        if (
-            "status" in jobs_analysis.columns
-            and "delisted_date" in jobs_analysis.columns
-        ):
-            logger.info("分析已下架職缺")
-            # 過濾出已下架的職缺
-            delisted_jobs = jobs_analysis[
-                (jobs_analysis["status"] == "inactive")
-                & (jobs_analysis["delisted_date"].notna())
-            ]
-
-            # 過濾出活躍的職缺（用於比較）
-            active_jobs = jobs_analysis[jobs_analysis["status"] == "active"]
-
-            if not delisted_jobs.empty:
-                logger.debug(f"找到 {len(delisted_jobs)} 個已下架職缺")
-                st.subheader("已經下架的職缺分析")
-
-                # 將下架日期轉換為日期格式
-                if "delisted_date" in delisted_jobs.columns:
-                    delisted_jobs["下架日期"] = pd.to_datetime(
-                        delisted_jobs["delisted_date"]
-                    )
-
-                    # 計算下架前在架天數
-                    if "上架日期" in delisted_jobs.columns:
-                        delisted_jobs["下架前在架天數"] = (
-                            delisted_jobs["下架日期"] - delisted_jobs["上架日期"]
-                        ).dt.days
-
-                        # 顯示下架職缺統計信息
-                        self.display_delisted_jobs_statistics(delisted_jobs)
-
-                        # 顯示下架職缺趨勢圖表
-                        self.display_delisted_jobs_trends(delisted_jobs)
-
-                        # 按下架日期排序，顯示最近下架的職缺
-                        sort_col = "下架日期"
-                    else:
-                        sort_col = "delisted_date"
-                else:
-                    sort_col = "jobNo"
-
-                # 添加篩選選項
-                st.subheader("下架職缺詳細資料")
-
-                # 創建篩選選項
-                col1, col2 = st.columns(2)
-                with col1:
-                    # 選擇排序方式
-                    sort_options = {
-                        "最近下架優先": (
-                            ("下架日期", False)
-                            if "下架日期" in delisted_jobs.columns
-                            else (sort_col, False)
-                        ),
-                        "最早下架優先": (
-                            ("下架日期", True)
-                            if "下架日期" in delisted_jobs.columns
-                            else (sort_col, True)
-                        ),
-                        "在架時間最長優先": (
-                            ("下架前在架天數", False)
-                            if "下架前在架天數" in delisted_jobs.columns
-                            else (sort_col, False)
-                        ),
-                        "在架時間最短優先": (
-                            ("下架前在架天數", True)
-                            if "下架前在架天數" in delisted_jobs.columns
-                            else (sort_col, True)
-                        ),
-                    }
-
-                    sort_by = st.selectbox(
-                        "排序方式", options=list(sort_options.keys()), index=0
-                    )
-
-                    sort_col, sort_ascending = sort_options[sort_by]
-
-                with col2:
-                    # 選擇顯示數量
-                    display_count = st.slider(
-                        "顯示數量", min_value=5, max_value=50, value=10, step=5
-                    )
-
-                # 顯示已下架職缺的詳細資料
-                st.write(f"### 已下架職缺列表 (共 {len(delisted_jobs)} 個)")
-
-                # 確保display_cols中的所有列都在delisted_jobs中
-                valid_cols = [
-                    col for col in display_cols if col in delisted_jobs.columns
-                ]
-
-                # 如果有下架日期列，添加到顯示列中
-                if "下架日期" in delisted_jobs.columns and "下架日期" not in valid_cols:
-                    valid_cols.append("下架日期")
-
-                # 如果有下架前在架天數列，添加到顯示列中
-                if (
-                    "下架前在架天數" in delisted_jobs.columns
-                    and "下架前在架天數" not in valid_cols
-                ):
-                    valid_cols.append("下架前在架天數")
-
-                # 排序並顯示數據
-                sorted_jobs = delisted_jobs.sort_values(
-                    sort_col, ascending=sort_ascending
+                # 提供下載功能，CSV內容按數據、排序和欄位快取
+                csv = _cached_delisted_csv(
+                    jobs_fingerprint(delisted_jobs),
+                    sort_col,
+                    sort_ascending,
+                    tuple(valid_cols),
+                    delisted_jobs,
                 )
-
-                st.dataframe(
-                    sorted_jobs.head(display_count)[valid_cols],
-                    column_config={
-                        "連結": st.column_config.LinkColumn(
-                            "連結", display_text="開啟連結", width="small"
-                        ),
-                        "下架日期": st.column_config.DatetimeColumn(
-                            "下架日期", format="YYYY-MM-DD"
-                        ),
-                        "下架前在架天數": st.column_config.NumberColumn(
-                            "下架前在架天數",
-                            help="職缺從上架到下架的天數",
-                            format="%d 天",
-                        ),
-                    },
-                    use_container_width=True,
+                st.download_button(
+                    label="下載完整下架職缺資料",
+                    data=csv,
+                    file_name=f"delisted_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                    mime="text/csv",
                 )
-
-                # 提供下載功能
-                if st.button("下載完整下架職缺資料"):
-                    csv = sorted_jobs[valid_cols].to_csv(index=False)
-                    st.download_button(
-                        label="確認下載CSV檔案",
-                        data=csv,
-                        file_name=f"delisted_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv",
-                    )
             else:
                 logger.debug("沒有找到已下架職缺")
                 st.info("沒有找到已下架的職缺資料")
@@ -1514,6 +1575,7 @@ class JobAnalysisRenderer:
 
 def show_dashboard_page(
     job_data_analyzer,
+    trend_analyzer,
     keywords=None,
     city=None,
     district=None,
@@ -1525,6 +1587,7 @@ def show_dashboard_page(
 
     參數:
         job_data_analyzer: 用於數據處理的JobDataAnalyzer實例
+        trend_analyzer: 用於趨勢分析的TrendAnalyzer實例
         keywords: 用於過濾職缺的關鍵詞列表，默認為None
         city: 用於過濾職缺的城市，默認為None
         district: 用於過濾職缺的地區，默認為None
@@ -1532,5 +1595,5 @@ def show_dashboard_page(
         months: 如果提供，只獲取最近N個月的職缺，默認為None
     """
     # 創建儀表板頁面並顯示
-    dashboard_page = DashboardPage(job_data_analyzer)
+    dashboard_page = DashboardPage(job_data_analyzer, trend_analyzer)
     dashboard_page.show(keywords, city, district, limit, months)
@@ -8,21 +8,109 @@ This module follows the Single Responsibility Principle by separating:
 3. Page controller (show_hiring_efficiency_page)
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import streamlit as st
 
 from apps.visualization.analysis.df_utils import (
     extract_application_counts,
+    jobs_fingerprint,
     prepare_jobs_analysis_df,
 )
-from apps.visualization.analysis.job_data_analyzer import JobDataAnalyzer
+from apps.visualization.analysis.job_data_analyzer import CACHE_TTL, JobDataAnalyzer
 from apps.visualization.components import display_filter_info
 from config.settings import logger
 
 
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_duration_histogram(
+    days: Tuple[float, ...], counts: Tuple[int, ...]
+) -> dict:
+    """
+    以各在架天數的職缺數為鍵快取在架時間分布直方圖，快取鍵的大小與職缺數量無關。
+
+    參數:
+        days: 出現過的在架天數
+        counts: 各在架天數的職缺數量
+
+    返回:
+        dict: Plotly圖表的字典形式
+    """
+    fig = px.histogram(
+        x=list(days),
+        y=list(counts),
+        histfunc="sum",
+        nbins=20,
+        title="職缺在架時間分布",
+        labels={"x": "在架天數"},
+        color_discrete_sequence=["skyblue"],
+    )
+    fig.update_layout(yaxis_title="count")
+    return fig.to_dict()
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_stacked_bar(
+    cross_table: pd.DataFrame, title: str, xaxis_title: str
+) -> dict:
+    """
+    以交叉表為鍵快取堆疊條形圖，交叉表只有少量行列，哈希成本很低。
+
+    參數:
+        cross_table: 交叉表DataFrame
+        title: 圖表標題
+        xaxis_title: X軸標題
+
+    返回:
+        dict: Plotly圖表的字典形式
+    """
+    fig = px.bar(cross_table, barmode="stack", title=title)
+    fig.update_layout(
+        xaxis_title=xaxis_title, yaxis_title="職缺數量", xaxis_tickangle=-45
+    )
+    return fig.to_dict()
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_pie(values: Tuple[int, ...], names: Tuple[str, ...], title: str) -> dict:
+    """
+    以各分類的數量為鍵快取餅圖。
+
+    參數:
+        values: 各分類的數量
+        names: 分類名稱
+        title: 圖表標題
+
+    返回:
+        dict: Plotly圖表的字典形式
+    """
+    return px.pie(values=list(values), names=list(names), title=title).to_dict()
+
+
+def _count_table(jobs_analysis: pd.DataFrame, row: str, column: str) -> pd.DataFrame:
+    """
+    計算兩個欄位的交叉計數表，結果與pd.crosstab相同。
+
+    直接分組計數再展開，category欄位只統計實際出現的組合。
+
+    參數:
+        jobs_analysis: 職缺分析數據DataFrame
+        row: 作為行的欄位
+        column: 作為列的欄位
+
+    返回:
+        pd.DataFrame: 交叉計數表
+    """
+    return (
+        jobs_analysis.groupby([row, column], observed=True)
+        .size()
+        .unstack(column, fill_value=0)
+    )
+
+
 # Component functions integrated from separate files
 def display_job_duration_distribution(jobs_analysis):
     """
@@ -38,13 +126,10 @@ def display_job_duration_distribution(jobs_analysis):
         st.subheader("職缺在架時間分布")
         logger.info("創建職缺在架時間分布圖表")
 
-        # 創建直方圖
-        fig = px.histogram(
-            jobs_analysis,
-            x="在架天數",
-            nbins=20,
-            title="職缺在架時間分布",
-            color_discrete_sequence=["skyblue"],
+        # 創建直方圖：先按在架天數計數，快取鍵只包含計數結果而非整列數據
+        duration_counts = jobs_analysis["在架天數"].value_counts(sort=False)
+        fig = _cached_duration_histogram(
+            tuple(duration_counts.index.tolist()), tuple(duration_counts.tolist())
         )
         st.plotly_chart(fig, use_container_width=True)
         logger.info("職缺在架時間分布圖表顯示完成")
@@ -65,15 +150,12 @@ def display_experience_application_relationship(jobs_analysis):
         logger.info("分析工作經驗與應徵人數關係")
 
         # 創建交叉表
-        exp_apply_cross = pd.crosstab(
-            jobs_analysis["工作經驗"], jobs_analysis["應徵人數範圍"]
-        )
+        exp_apply_cross = _count_table(jobs_analysis, "工作經驗", "應徵人數範圍")
         logger.debug(f"交叉表大小: {exp_apply_cross.shape}")
 
         # 創建堆疊條形圖
-        fig = px.bar(exp_apply_cross, barmode="stack", title="工作經驗與應徵人數關係")
-        fig.update_layout(
-            xaxis_title="工作經驗要求", yaxis_title="職缺數量", xaxis_tickangle=-45
+        fig = _cached_stacked_bar(
+            exp_apply_cross, "工作經驗與應徵人數關係", "工作經驗要求"
         )
         st.plotly_chart(fig, use_container_width=True)
         logger.info("工作經驗與應徵人數關係圖表顯示完成")
@@ -94,11 +176,13 @@ def display_job_competition_distribution(jobs_analysis):
         logger.info("創建職缺競爭度分布圖表")
 
         # 創建餅圖
+        # 職缺競爭度為固定分類的category欄位，去掉未出現的分類，不繪製數量為0的扇區
         competition_counts = jobs_analysis["職缺競爭度"].value_counts()
-        fig = px.pie(
-            values=competition_counts.values,
-            names=competition_counts.index,
-            title="職缺競爭度分布",
+        competition_counts = competition_counts[competition_counts > 0]
+        fig = _cached_pie(
+            tuple(competition_counts.tolist()),
+            tuple(competition_counts.index.astype(str)),
+            "職缺競爭度分布",
         )
         st.plotly_chart(fig, use_container_width=True)
         logger.info("職缺競爭度分布圖表顯示完成")
@@ -119,15 +203,12 @@ def display_education_salary_relationship(jobs_analysis):
         logger.info("分析教育程度與薪資範圍關係")
 
         # 創建交叉表
-        edu_salary_cross = pd.crosstab(
-            jobs_analysis["教育程度"], jobs_analysis["薪資範圍"]
-        )
+        edu_salary_cross = _count_table(jobs_analysis, "教育程度", "薪資範圍")
         logger.debug(f"交叉表大小: {edu_salary_cross.shape}")
 
         # 創建堆疊條形圖
-        fig = px.bar(edu_salary_cross, barmode="stack", title="教育程度與薪資範圍關係")
-        fig.update_layout(
-            xaxis_title="教育程度要求", yaxis_title="職缺數量", xaxis_tickangle=-45
+        fig = _cached_stacked_bar(
+            edu_salary_cross, "教育程度與薪資範圍關係", "教育程度要求"
         )
         st.plotly_chart(fig, use_container_width=True)
         logger.info("教育程度與薪資範圍關係圖表顯示完成")
@@ -216,6 +297,76 @@ REQUIRED_COLUMNS = [
 ]
 LOW_COMPETITION_RANGES = ["0~5人應徵"]
 HIGH_COMPETITION_RANGES = ["大於30人應徵"]
+COMPETITION_LEVELS = ["低", "中等", "高"]
+# 交叉表和分組使用的低基數文字欄位，不同值佔比低於門檻時轉換為category
+CATEGORY_COLUMNS = ["工作經驗", "教育程度", "應徵人數範圍", "薪資範圍"]
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+# 其餘文字欄位改用PyArrow字串類型（pyarrow由streamlit引入）
+ARROW_STRING_COLUMNS = ["職稱", "公司名稱", "連結"]
+
+
+def _optimize_memory(jobs_analysis: pd.DataFrame) -> pd.DataFrame:
+    """
+    縮小職缺分析數據的欄位類型：整數和浮點數向下轉型，低基數文字欄位轉為category，
+    其他文字欄位轉為PyArrow字串。
+
+    參數:
+        jobs_analysis: 職缺分析數據DataFrame
+
+    返回:
+        pd.DataFrame: 轉換類型後的DataFrame
+    """
+    for col in jobs_analysis.columns:
+        dtype = jobs_analysis[col].dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            continue
+        if pd.api.types.is_integer_dtype(dtype):
+            jobs_analysis[col] = pd.to_numeric(jobs_analysis[col], downcast="integer")
+        elif pd.api.types.is_float_dtype(dtype):
+            jobs_analysis[col] = pd.to_numeric(jobs_analysis[col], downcast="float")
+
+    row_count = len(jobs_analysis)
+    for col in CATEGORY_COLUMNS + ARROW_STRING_COLUMNS:
+        if col not in jobs_analysis.columns:
+            continue
+        # 只轉換尚未轉換的文字欄位（object或pandas字串類型，已是category的跳過）
+        dtype = jobs_analysis[col].dtype
+        if isinstance(dtype, pd.CategoricalDtype) or not (
+            pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+        ):
+            continue
+        if (
+            col in CATEGORY_COLUMNS
+            and jobs_analysis[col].nunique() < row_count * CATEGORY_MAX_UNIQUE_RATIO
+        ):
+            jobs_analysis[col] = jobs_analysis[col].astype("category")
+        else:
+            jobs_analysis[col] = jobs_analysis[col].astype("string[pyarrow]")
+
+    return jobs_analysis
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_analysis_data(
+    _processor: "HiringEfficiencyDataProcessor",
+    fingerprint: tuple,
+    as_of: pd.Timestamp,
+    _jobs_df: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    以數據指紋和基準日期為鍵快取分析數據，拖動滑桿或切換選項時不會重跑整個數據處理流程。
+
+    參數:
+        _processor: HiringEfficiencyDataProcessor實例，使用前導下劃線告訴Streamlit不要嘗試對此參數進行哈希處理
+        fingerprint: 職缺數據的指紋
+        as_of: 計算在架天數的基準日期
+        _jobs_df: 職缺數據DataFrame，不參與哈希
+
+    返回:
+        pd.DataFrame: 職缺分析數據DataFrame
+    """
+    jobs_analysis = _processor.prepare_analysis_data(_jobs_df, as_of)
+    return _processor.process_application_data(jobs_analysis)
 
 
 class HiringEfficiencyDataProcessor:
@@ -274,18 +425,34 @@ class HiringEfficiencyDataProcessor:
         logger.debug("檢查職缺數據是否包含所需列")
         return [col for col in REQUIRED_COLUMNS if col not in jobs_df.columns]
 
-    def prepare_analysis_data(self, jobs_df: pd.DataFrame) -> pd.DataFrame:
+    def get_analysis_data(self, jobs_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        取得已處理應徵人數和競爭度的職缺分析數據，結果經快取。
+
+        Args:
+            jobs_df: 職缺數據DataFrame
+
+        Returns:
+            職缺分析數據DataFrame
+        """
+        as_of = pd.Timestamp.now().normalize()
+        return _cached_analysis_data(self, jobs_fingerprint(jobs_df), as_of, jobs_df)
+
+    def prepare_analysis_data(
+        self, jobs_df: pd.DataFrame, as_of: Optional[pd.Timestamp] = None
+    ) -> pd.DataFrame:
         """
         準備職缺分析數據。
 
         Args:
             jobs_df: 職缺數據DataFrame
+            as_of: 計算在架天數的基準日期，預設為今天零時
 
         Returns:
             職缺分析數據DataFrame
         """
         logger.info("準備職缺分析數據")
-        jobs_analysis = prepare_jobs_analysis_df(jobs_df)
+        jobs_analysis = _optimize_memory(prepare_jobs_analysis_df(jobs_df, as_of))
         logger.debug(f"準備了 {len(jobs_analysis)} 條職缺分析數據")
         return jobs_analysis
 
@@ -307,14 +474,18 @@ class HiringEfficiencyDataProcessor:
 
             # 計算職缺競爭度
             logger.info("計算職缺競爭度")
-            jobs_analysis["職缺競爭度"] = "中等"
-            jobs_analysis.loc[
-                jobs_analysis["應徵人數範圍"].isin(LOW_COMPETITION_RANGES), "職缺競爭度"
-            ] = "低"
-            jobs_analysis.loc[
-                jobs_analysis["應徵人數範圍"].isin(HIGH_COMPETITION_RANGES),
-                "職缺競爭度",
-            ] = "高"
+            apply_ranges = jobs_analysis["應徵人數範圍"].to_numpy()
+            jobs_analysis["職缺競爭度"] = pd.Categorical(
+                np.select(
+                    [
+                        np.isin(apply_ranges, LOW_COMPETITION_RANGES),
+                        np.isin(apply_ranges, HIGH_COMPETITION_RANGES),
+                    ],
+                    ["低", "高"],
+                    default="中等",
+                ),
+                categories=COMPETITION_LEVELS,
+            )
             logger.debug("職缺競爭度計算完成")
 
         return jobs_analysis
@@ -432,11 +603,8 @@ def show_hiring_efficiency_page(
         missing_cols = data_processor.check_required_columns(jobs_df)
         page_renderer.render_missing_columns_info(missing_cols)
 
-        # 準備分析數據
-        jobs_analysis = data_processor.prepare_analysis_data(jobs_df)
-
-        # 處理應徵人數數據
-        jobs_analysis = data_processor.process_application_data(jobs_analysis)
+        # 準備分析數據並處理應徵人數數據
+        jobs_analysis = data_processor.get_analysis_data(jobs_df)
 
         # 渲染分析圖表
         page_renderer.render_analysis_charts(job_data_analyzer, jobs_analysis)
@@ -515,6 +515,33 @@ class DuckDBManager:
         result = self.conn.execute(query, params).fetchdf()
         return result
 
+    def get_delisted_counts_by_date(self, start_date, end_date) -> pd.DataFrame:
+        """
+        在數據庫中按下架日期統計指定日期範圍內的下架職缺數量。
+
+        參數:
+            start_date: 開始日期
+            end_date: 結束日期
+
+        返回:
+            pd.DataFrame: 包含date和delisted_count兩列、按日期排序的DataFrame。
+        """
+        # 下架日期可能是字串或時間戳，先轉為時間戳再取日期，無法解析的值視為空值
+        query = """
+            SELECT CAST(TRY_CAST(delisted_date AS TIMESTAMP) AS DATE) AS date,
+                   COUNT(*) AS delisted_count
+            FROM news_jobs
+            WHERE status = 'inactive'
+              AND CAST(TRY_CAST(delisted_date AS TIMESTAMP) AS DATE) BETWEEN ? AND ?
+            GROUP BY 1
+            ORDER BY 1
+        """
+        params = [pd.Timestamp(start_date).date(), pd.Timestamp(end_date).date()]
+
+        result = self.conn.execute(query, params).fetchdf()
+        result["date"] = pd.to_datetime(result["date"]).astype("datetime64[ns]")
+        return result
+
     def insert_jobs(self, jobs: List[Dict]) -> int:
         """
         將職缺數據保存到news_jobs表中。